@@ -4,9 +4,14 @@ This module contains :class:`EAClient`, the entrypoint for users to make request
 """
 
 import os
-from typing import Any, Dict, List, Optional, Union
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from everyaction.core import ea_endpoint, EAService
 from everyaction.exception import EAException
@@ -27,12 +32,25 @@ class EAClient(EAService):
     # Endpoint for most non-US clients.
     _INTL_ENDPOINT: str = 'https://intlapi.securevan.com/v4'
 
+    # Maximum number of connections to keep alive per host, so that requests sent from multiple threads may reuse them.
+    _MAX_POOL_SIZE: int = 64
+
     # Everyaction database modes. The index of the mode is the number to be appended to the API key.
     _MODES: List[str] = [
         'VoterFile',
         'MyCampaign'
     ]
 
+    # Number of per-host connection pools to cache.
+    _NUM_POOLS: int = 32
+
+    # Retry policy shared by the connection pools of every client. Initialized after the class body since it depends on
+    # _RETRY_STATUSES.
+    _RETRY: Retry
+
+    # Retry idempotent requests which fail for these transient status codes.
+    _RETRY_STATUSES: List[int] = [429, 502, 503, 504]
+
     # Mapping from short endpoint names to their corresponding endpoints.
     # Initialized by EAClient._resolve_endpoint(short_name).
     _SHORT_NAME_TO_ENDPOINT: Dict[str, str] = {}
@@ -258,6 +276,22 @@ class EAClient(EAService):
             return route
         return f'{self.endpoint}/{route}'
 
+    def _throttle(self) -> None:
+        # Block until another request may be sent without exceeding the rate limit, if there is one. This is a token
+        # bucket: tokens are replenished at rate_limit per second up to burst, and each request consumes one. Waiting
+        # while holding the lock is intentional, so that threads are let through one at a time in order.
+        if not self._rate_limit:
+            return
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate_limit)
+            self._last_refill = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self._rate_limit)
+                self._last_refill = time.monotonic()
+                self._tokens = 1
+            self._tokens -= 1
+
     def _mode_num(self) -> int:
         # Get the mode number using the API key.
         return int(self._session.auth[1][-1])
@@ -269,7 +303,11 @@ class EAClient(EAService):
         *,
         endpoint: Optional[str] = None,
         mode: Optional[Union[int, str]] = None,
-        from_env: Optional[bool] = None
+        from_env: Optional[bool] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        coalesce_gets: bool = False
     ) -> None:
         """Use the given arguments and environment variables to initialize the client.
 
@@ -293,6 +331,16 @@ class EAClient(EAService):
             unspecified when either of `app_name` or `api_key` is specified. `mode` may either be explicitly specified,
             or implicit in the api key environment variable (but not both). When none of `app_name`, `api_key`, or
             `from_env` is specified, the default behavior is to proceed as if `from_env=True`.
+        :param rate_limit: When specified, the maximum average number of requests per second this client will send,
+            across all threads and services. Requests which would exceed this rate wait until they may be sent.
+        :param burst: The number of requests which may be sent at once before `rate_limit` takes effect. Defaults to
+            `rate_limit` rounded down, or 1 if that is smaller.
+        :param pool_size: Maximum number of connections to keep alive for reuse. Defaults to 64, or to `burst` if that
+            is larger. Raise this when sending more requests concurrently than that, since connections beyond this size
+            are closed after each request instead of being reused.
+        :param coalesce_gets: When `True`, a GET request identical to one already being sent by another thread waits for
+            and shares that request's response instead of being sent itself. Only enable this when no thread depends on
+            reading its own writes, since the shared response may have been requested before such a write.
         """
         super().__init__(self)
         self._endpoint = self._resolve_endpoint(endpoint or 'US')
@@ -335,9 +383,42 @@ class EAClient(EAService):
         else:
             raise EAException('mode must either be specified or be implicit in the given API key.')
 
+        # Check the remaining arguments before creating the session, so that an invalid argument does not leave it open.
+        if rate_limit is not None and rate_limit <= 0:
+            raise EAException(f'rate_limit must be positive, not {rate_limit}.')
+        if burst is not None and burst < 1:
+            raise EAException(f'burst must be at least 1, not {burst}.')
+        if burst is not None and rate_limit is None:
+            raise EAException('burst may only be specified when rate_limit is specified.')
+        if pool_size is not None and pool_size < 1:
+            raise EAException(f'pool_size must be at least 1, not {pool_size}.')
+
         self._session = Session()
         self._session.auth = (app_name, api_key)
 
+        # Token bucket state used by _throttle to keep requests under rate_limit.
+        self._rate_limit = rate_limit
+        self._burst = burst or max(1, int(rate_limit or 0))
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._rate_limit_lock = Lock()
+
+        # Keep connections alive in a pool large enough for concurrent use, and retry transient failures. The pool
+        # should be able to hold at least as many connections as requests that the rate limit allows at once.
+        adapter = HTTPAdapter(
+            pool_connections=self._NUM_POOLS,
+            pool_maxsize=pool_size or max(self._MAX_POOL_SIZE, self._burst),
+            max_retries=self._RETRY
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # GET requests currently being sent, so that identical concurrent requests may share a single response when
+        # coalesce_gets is True.
+        self._coalesce_gets = coalesce_gets
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._in_flight_lock = Lock()
+
         # Mode number not verified yet if mode implicit in api key.
         self._check_mode_number(self._mode_num())
 
@@ -433,6 +514,15 @@ class EAClient(EAService):
         """
         return self._api_key_profile()[0]
 
+    def clear_cache(self) -> None:
+        """Clear the cached results of endpoints for reference data, such as
+        :meth:`ReportedDemographics.genders <.ReportedDemographics.genders>`, so that they are requested again the next
+        time they are needed.
+        """
+        for service in vars(self).values():
+            if isinstance(service, EAService):
+                service._cache.clear()
+
     def close(self) -> None:
         """Close the session associated with this client. Note that you will not be able to send requests after calling
         this method.
@@ -446,16 +536,44 @@ class EAClient(EAService):
         :param kwargs: Additional arguments to pass to the request.
         :return: The :class:`Response` to the request.
         """
+        self._throttle()
         return self._session.delete(self._add_base(f'{self.endpoint}/{route}'), **kwargs)
 
     def get(self, route: str, **kwargs: Any) -> Response:
-        """Send a GET request to the configured EveryAction endpoint with the given path and arguments.
+        """Send a GET request to the configured EveryAction endpoint with the given path and arguments. If this client
+        was created with `coalesce_gets=True` and an identical GET request is already being sent by another thread, wait
+        for it and return its response instead of sending another request.
 
         :param route: Path to send request to.
         :param kwargs: Additional arguments to pass to the request.
-        :return: The :class:`Response` to the request.
+        :return: The :class:`Response` to the request. When `coalesce_gets` is `True`, the same :class:`Response` may be
+            returned to multiple threads, so it should not be modified.
         """
-        return self._session.get(self._add_base(f'{self.endpoint}/{route}'), **kwargs)
+        url = self._add_base(f'{self.endpoint}/{route}')
+        if not self._coalesce_gets:
+            self._throttle()
+            return self._session.get(url, **kwargs)
+        key = (url, repr(sorted(kwargs.items())))
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_sender = future is None
+            if is_sender:
+                future = self._in_flight[key] = Future()
+        if not is_sender:
+            return future.result()
+
+        try:
+            self._throttle()
+            response = self._session.get(url, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+        return response
 
     def patch(self, route: str, **kwargs: Any) -> Response:
         """Send a PATCH request to the configured EveryAction endpoint with the given path and arguments.
@@ -464,6 +582,7 @@ class EAClient(EAService):
         :param kwargs: Additional arguments to pass to the request.
         :return: The :class:`Response` to the request.
         """
+        self._throttle()
         return self._session.patch(self._add_base(f'{self.endpoint}/{route}'), **kwargs)
 
     def post(self, route: str, **kwargs: Any) -> Response:
@@ -473,6 +592,7 @@ class EAClient(EAService):
         :param kwargs: Additional arguments to pass to the request.
         :return: The :class:`Response` to the request.
         """
+        self._throttle()
         return self._session.post(self._add_base(f'{self.endpoint}/{route}'), **kwargs)
 
     def put(self, route: str, **kwargs: Any) -> Response:
@@ -482,6 +602,7 @@ class EAClient(EAService):
         :param kwargs: Additional arguments to pass to the request.
         :return: The :class:`Response` to the request.
         """
+        self._throttle()
         return self._session.put(self._add_base(f'{self.endpoint}/{route}'), **kwargs)
 
 
@@ -493,3 +614,7 @@ EAClient._SHORT_NAME_TO_ENDPOINT = {
 }
 
 EAClient._MODE_TO_NUM = {name.lower(): num for num, name in enumerate(EAClient._MODES)}
+
+# Retry objects are never mutated by urllib3 (each retry creates a new one), so one instance may be shared. The last
+# response is still returned when retries are exhausted so that it may be raised as an EAHTTPException.
+EAClient._RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=EAClient._RETRY_STATUSES, raise_on_status=False)
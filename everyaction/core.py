@@ -8,9 +8,11 @@ import json
 import re
 import sys
 import textwrap
+import time
 import typing
 from abc import ABC, ABCMeta
 from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 from json import JSONEncoder
 from typing import Any, Callable, Dict, Iterator, List, NewType, Optional, Set, Tuple, Type, TypeVar, Union
 
@@ -18,6 +20,12 @@ from makefun import wraps
 
 from everyaction.exception import EAException, EAHTTPException
 
+# orjson is an optional dependency which parses JSON considerably faster than the standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from everyaction.client import EAClient
@@ -51,6 +59,18 @@ _SUPPORTED_REQUEST_TYPES = {'delete', 'get', 'patch', 'post', 'put'}
 # Regex used to replace $top query arg in path.
 _TOP_REGEX = re.compile(r'\$top=\d*')
 
+# Function used to parse response JSON data.
+_loads = orjson.loads if orjson else json.loads
+
+
+# Function used to serialize request JSON data. orjson gives bytes, which requests sends as the request body as-is.
+if orjson:
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, cls=EAObjectEncoder)
+
 # Type parameter for types bounded by EAObjects.
 E = TypeVar('E', bound='EAObject')
 
@@ -92,7 +112,9 @@ def ea_endpoint(
     result_key: Optional[str] = None,
     result_factory: Optional[Callable] = None,
     exclude_keys: Set[str] = frozenset(),
-    none_if_404: bool = False
+    none_if_404: bool = False,
+    cache_ttl: float = 0,
+    iterate: bool = False
 ) -> Callable:
     # This decorator uses consistencies and parameters (e.g., max value for top in a paginated request) in the
     # EveryAction API to "configure" how the request data and arguments are processed, how the request is sent, and how
@@ -160,6 +182,15 @@ def ea_endpoint(
 
     # none_if_404: When specified, return None rather than erroring upon receiving a response with status code 404.
 
+    # cache_ttl: When positive, results are cached by the service for this many seconds, keyed by the arguments given.
+    # Only appropriate for reference data which rarely changes, such as reported genders. Copies of cached results are
+    # returned so that callers may freely modify them.
+
+    # iterate: Only applicable when paginated=True. When True, the method returns an iterator over the resulting records
+    # instead of a list, requesting each page only once the records from the previous page have been consumed so that
+    # arbitrarily many records may be processed using constant memory. Since the point of iterating is to process every
+    # record, limit defaults to 0 (unlimited) rather than to the client's default_limit.
+
     # How EAProperty objects are resolved:
     # Firstly, if data_type is specified, data_type._properties() populates the collection of properties.
     #
@@ -212,8 +243,20 @@ def ea_endpoint(
             f'True/present.'
         )
 
+    if iterate and not paginated:
+        raise AssertionError(f'iterate={iterate} may only be specified when paginated=True.')
+
+    if iterate and cache_ttl:
+        raise AssertionError(f'iterate={iterate} and cache_ttl={cache_ttl} may not both be specified.')
+
     props = props or {}
 
+    # Freeze the key sets (callers typically pass set literals) and intern their names, since they are used for
+    # membership tests and as dict keys on every call.
+    prop_keys = frozenset(sys.intern(k) for k in prop_keys)
+    path_params_to_data = frozenset(sys.intern(k) for k in path_params_to_data)
+    exclude_keys = frozenset(sys.intern(k) for k in exclude_keys)
+
     # paginated, result_array, and result_array_key all specify different ways to extract a sequence of objects from
     # response data. They are therefore mutually exclusive.
     if sum(bool(x) for x in [paginated, result_array, result_array_key] if x) > 1:
@@ -224,6 +267,10 @@ def ea_endpoint(
 
     path_params = _parse_path_params(path_template)
 
+    # The path template with each path parameter replaced by its position, so that routes may be formatted directly from
+    # positional arguments without first mapping them to their names.
+    positional_template = re.sub(r'{([^}]*)}', lambda m: f'{{{path_params.index(m.group(1))}}}', path_template)
+
     if any(k not in path_params for k in path_params_to_data):
         raise AssertionError(
             f'path_params_to_data={path_params_to_data} contains keys not in path_params={path_params}'
@@ -236,7 +283,12 @@ def ea_endpoint(
         # First, take the properties from the class data_type, if specified.
         properties.update(data_type._properties())
 
-    all_keys = prop_keys | {q.lstrip('$') for q in query_arg_keys} | path_params_to_data
+    # Pairs of (name without "$", query arg name) for each query arg key. Computed once here so that the wrapper does
+    # not need to strip each key on every call. Names are interned since they are repeatedly used as dict keys.
+    query_arg_names = tuple((sys.intern(k.lstrip('$')), sys.intern(k)) for k in query_arg_keys)
+
+    stripped_query_arg_names = frozenset(stripped for stripped, _ in query_arg_names)
+    all_keys = prop_keys | stripped_query_arg_names | path_params_to_data
     # Specifying keys in more than one of these sets is redundant. Check that they are disjoint sets by confirming that
     # the size of their unions is the sum of their sizes.
     if len(all_keys) != len(prop_keys) + len(query_arg_keys) + len(path_params_to_data):
@@ -271,6 +323,12 @@ def ea_endpoint(
 
     properties = EAProperties(properties)
 
+    # (Position in args, name, property) for each path parameter which should be duplicated as JSON data, so that the
+    # wrapper may index args directly instead of mapping every path parameter to its name on each call.
+    path_params_to_copy = tuple(
+        (path_params.index(name), name, properties[name]) for name in sorted(path_params_to_data)
+    )
+
     # Allow paginated and result_array_key to imply result_array so the code logic is simpler.
     result_array = result_array or result_array_key or paginated
 
@@ -338,15 +396,14 @@ def ea_endpoint(
             # EAClient.{delete, get, patch, post, put}.
             request_method = getattr(self.ea, req_type)
 
-            # Path param name -> value
-            name_to_path_param = dict(zip(path_params, args))
-            for param_name in path_params_to_data:
+            for i, param_name, prop in path_params_to_copy:
                 # If path_params_to_data specifies path parameters which should be duplicated as JSON data, do so.
-                if properties[param_name].find(param_name, kwargs) is None:
+                if prop.find(param_name, kwargs) is None:
                     # Only add it if it is absent.
-                    kwargs[param_name] = name_to_path_param[param_name]
-            # Use Python str formatting to expand path parameters to the given values.
-            route = path_template.format(**name_to_path_param)
+                    kwargs[param_name] = args[i]
+            # Use Python str formatting to expand path parameters to the given values. Paths without parameters are
+            # used as-is.
+            route = positional_template.format(*args) if path_params else path_template
 
             # Finally, process the arguments, resolving aliases to the actual keys expected by the EveryAction API.
             try:
@@ -356,9 +413,8 @@ def ea_endpoint(
                 attr = str(e).replace("'", '')
                 raise EAException(f'Name or alias "{attr}" not recognized by {func_ref_name}.')
             query_args = {}
-            for k in query_arg_keys:
+            for stripped, k in query_arg_names:
                 # Query args starting with $ may be specified without the $.
-                stripped = k.lstrip('$')
                 if stripped in data_args:
                     query_arg = data_args.pop(stripped)
                     if not isinstance(query_arg, str):
@@ -369,7 +425,8 @@ def ea_endpoint(
             if paginated:
                 if top is not None:
                     raise EAException('$top is not supported for the Python EveryAction API, use limit instead.')
-                limit = self.ea.default_limit if limit is None else limit
+                if limit is None:
+                    limit = 0 if iterate else self.ea.default_limit
                 # The query arg for top needs to be at most max_top
                 query_args['$top'] = min(limit, max_top) or max_top
                 query_args['$skip'] = 0 if skip is None else skip
@@ -388,7 +445,7 @@ def ea_endpoint(
 
             # If raw data is specified in the argument "data", use that instead of whatever remains in data_args.
             data = data or data_args
-            json_data = json.dumps(data, cls=EAObjectEncoder)
+            json_data = _dumps(data)
             response = request_method(
                 route,
                 params=query_args,
@@ -407,27 +464,14 @@ def ea_endpoint(
                 # Return early instead of attempting response JSON data processing.
                 return
 
-            resp_data = response.json()
+            resp_data = _loads(response.content)
 
             if result_array:
                 if paginated:
                     # If paginated, keep getting records until either we reach the requested limit or we get all
                     # records.
-
-                    # Paginated responses always have an "items" key, which is a list of results.
-                    items = resp_data['items']
-                    next_page = resp_data['nextPageLink']
-                    while (not limit or len(items) < limit) and next_page:
-                        if 0 < limit - len(items) < max_top:
-                            # Replace $top=<num> with $top={limit - len(items)} so we receive at most that many.
-                            next_page = _TOP_REGEX.sub(f'$top={limit - len(items)}', next_page)
-                        # Query arguments will be implicit in the URL given by nextPageLink.
-                        response = request_method(next_page, json=json_data)
-                        if not response:
-                            raise EAHTTPException(response)
-                        resp_data = response.json()
-                        items += resp_data['items']
-                        next_page = resp_data['nextPageLink']
+                    records = (factory(x) for x in _paginate(request_method, resp_data, json_data, limit, max_top))
+                    return records if iterate else list(records)
                 else:
                     # Sometimes response JSON data for arrays is a sequence, other times it's a map with a single key
                     # for the sequence.
@@ -438,19 +482,71 @@ def ea_endpoint(
                 return [factory(x) for x in items]
             else:
                 return factory(resp_data)
-        return wrapper
+
+        if not cache_ttl:
+            return wrapper
+
+        @wraps(func)
+        def cached_wrapper(self: EAService, *args: Any, **kwargs: Any) -> Any:
+            if paginated and kwargs.get('limit') is None:
+                # Resolve the limit now so that it is part of the key: otherwise, results cached under a previous
+                # value of default_limit would be returned after it changes.
+                kwargs['limit'] = self.ea.default_limit
+            key = (func_ref_name, repr((args, sorted(kwargs.items()))))
+            now = time.monotonic()
+            cached = self._cache.get(key)
+            if cached is not None and now < cached[0]:
+                return copy.deepcopy(cached[1])
+            result = wrapper(self, *args, **kwargs)
+            self._cache[key] = (now + cache_ttl, copy.deepcopy(result))
+            return result
+        return cached_wrapper
     return inner
 
 
+def _paginate(
+    request_method: Callable, resp_data: EAValue, json_data: Union[str, bytes], limit: int, max_top: int
+) -> Iterator[EAValue]:
+    # Yields the items of a paginated response starting with the page in resp_data, requesting each subsequent page only
+    # once the items of the previous page have been yielded. Stops once either limit items have been yielded (when limit
+    # is nonzero) or there are no more pages.
+    count = 0
+    while True:
+        # Paginated responses always have an "items" key, which is a list of results.
+        items = resp_data['items']
+        if limit:
+            # Never yield more than limit items, even if the server ignores the requested value for $top.
+            items = items[:limit - count]
+        yield from items
+        count += len(items)
+        next_page = resp_data['nextPageLink']
+        if (limit and count >= limit) or not next_page:
+            return
+        if 0 < limit - count < max_top:
+            # Replace $top=<num> with $top={limit - count} so we receive at most that many.
+            next_page = _TOP_REGEX.sub(f'$top={limit - count}', next_page)
+        # Query arguments will be implicit in the URL given by nextPageLink.
+        response = request_method(next_page, data=json_data, headers={'Content-Type': 'application/json'})
+        if not response:
+            raise EAHTTPException(response)
+        resp_data = _loads(response.content)
+
+
+@lru_cache(maxsize=4096)
 def to_snake(attr: str) -> str:
     # Convert camelCased or UpperCased attribute name to a snake_cased attribute name.
     # Use lower() to force all characters to be lower-cased after they are replaced.
+    # Results are cached since the same property names are converted repeatedly, both when classes are created and
+    # when searching for property values in request arguments.
 
     return _TO_SNAKE_REGEX2.sub(r'\1_\2', _TO_SNAKE_REGEX1.sub(r'\1_\2', attr)).lower()
 
 
 class EAService(ABC):
     # Abstract base class of groups of API endpoints, like People or Contributions.
+    # Services do not own any transport: every request is sent through self.ea, so all of a client's services share the
+    # client's Session and therefore its connection pool. Keep it this way rather than giving services their own
+    # sessions, which would force extra connection setup when a script uses several services back-to-back.
     def __init__(self, ea: EAClient) -> None:
         """Initialize this service with the given client.
 
@@ -458,6 +554,9 @@ class EAService(ABC):
         """
         self.ea = ea
 
+        # Results of endpoints with a cache_ttl. Maps (endpoint name, arguments) -> (expiration time, result).
+        self._cache = {}
+
 
 class EAProperty:
     # Represents a single property associated with an EveryAction object.
@@ -476,25 +575,28 @@ class EAProperty:
     @staticmethod
     def share(**kwargs: 'EAProperty') -> None:
         # Add an EAProperty to shared properties.
+        # Adding a property of the same name twice is not allowed, so assert none of these are shared yet as it is
+        # assumed that developers add a finite amount of constant properties. Check all of them before adding any so
+        # that a failure does not leave only some of them shared.
+        duplicates = kwargs.keys() & EAProperty._shared.keys()
+        if duplicates:
+            raise AssertionError(f'{next(k for k in kwargs if k in duplicates)} is already a shared property')
         for k, v in kwargs.items():
-            # Adding a property of the same name twice is not allowed, so assert this is False as it is assumed that
-            # developers add a finite amount of constant properties.
-            if k in EAProperty._shared:
-                raise AssertionError(f'{k} is already a shared property')
             # Add snake-cased name as alias if it hasn't been already.
             as_snake = to_snake(k)
             if as_snake != k:
                 v.aliases.add(as_snake)
-            EAProperty._shared[k] = v
+        EAProperty._shared.update(kwargs)
 
     @staticmethod
     def shared(name: str) -> 'EAProperty':
         # Get a shared EAProperty.
-        if name not in EAProperty._shared:
+        try:
+            return EAProperty._shared[name]
+        except KeyError:
             # AssertionError raised because this is only called when creating decorators and data types, both of which
             # are finite in number and done by the developer, not the user.
-            raise AssertionError(f'{name} is not a shared property')
-        return EAProperty._shared[name]
+            raise AssertionError(f'{name} is not a shared property') from None
 
     def __init__(
         self,
@@ -581,6 +683,9 @@ class EAProperty:
         return self.value(name, result)
 
     def value(self, name_or_alias: str, arg: Any) -> Optional[Union[E, List[E]]]:
+        if not (self.factory or self.is_array):
+            # Most properties are plain values which need no processing, including when arg is None.
+            return arg
         if arg is None:
             # Always return None for None arg.
             return None
@@ -682,9 +787,8 @@ class EAProperties(Mapping):
             resolved = self.resolve(k)
             if resolved in result:
                 raise EAException(f'Multiple aliases for "{resolved}" given in {args}')
-            prop = self[resolved]
-            value = prop.value(k, v)
-            result[resolved] = value
+            # Index _properties directly since the alias has already been resolved.
+            result[resolved] = self._properties[resolved].value(k, v)
         return result
 
     def resolve(self, alias: str) -> str:
@@ -985,7 +1089,9 @@ class EAObject(MutableMapping, metaclass=EAMeta):
         del self.__dict__[self._resolve_attr(k)]
 
     def __eq__(self, other: E) -> bool:
-        return (type(self) == type(other)) and super().__eq__(other)
+        # The items are exactly the contents of __dict__, so compare those directly rather than through Mapping.__eq__,
+        # which builds a dict for each object by getting every item.
+        return (type(self) == type(other)) and self.__dict__ == other.__dict__
 
     def __getattr__(self, attr: str) -> EAValue:
         # This __getattr__ implementation will search for aliases for the given attribute.
@@ -1042,6 +1148,13 @@ class EAObject(MutableMapping, metaclass=EAMeta):
         setattr(self, k, v)
 
 
+def _encode_default(o: Any) -> Any:
+    # Serializes objects orjson does not natively support, like EAObjectEncoder does for the standard library.
+    if isinstance(o, EAObject):
+        return o.__dict__
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
 class EAObjectEncoder(JSONEncoder):
     def default(self, o: Any) -> Any:
         if isinstance(o, EAObject):
@@ -71,6 +71,6 @@ class EAHTTPException(EAException):
             msg_components.append(f'Reason: {self.errors[0].text}')
         elif len(self.errors) != 0:
             msg_components.append('Reasons:')
-            [msg_components.append(f'* {e.text}') for e in self.errors]
+            msg_components.extend(f'* {e.text}' for e in self.errors)
 
         super().__init__('\n'.join(msg_components))
@@ -4,7 +4,10 @@ This module contains the objects that have methods corresponding to collections
 """
 
 import time
-from typing import Dict, Iterable, List, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import requests
 
@@ -66,6 +69,35 @@ __all__ = [
 ]
 
 
+# Number of seconds to cache the results of endpoints for reference data which rarely changes.
+_REFERENCE_DATA_TTL = 60 * 60
+
+
+# Default maximum number of requests sent at once by methods which fan out over single-record endpoints, like bulk_get.
+_DEFAULT_MAX_WORKERS = 16
+
+
+def _each(func: Callable[[Any], Any], args: Iterable[Any], max_workers: int) -> List[Any]:
+    # Calls func on each of args using a bounded thread pool and gives the results in the same order as args. Every
+    # request goes through the client's Session, so they share its connection pool. A call is only started once an
+    # earlier one has finished without raising, so that after a call raises no more are started: for example,
+    # bulk_delete stops deleting records. Calls already started still finish before the exception is raised.
+    remaining = iter(args)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, arg) for arg in islice(remaining, max_workers)]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # Raises the exception of a failed call.
+                future.result()
+                for arg in islice(remaining, 1):
+                    next_future = executor.submit(func, arg)
+                    futures.append(next_future)
+                    pending.add(next_future)
+        return [future.result() for future in futures]
+
+
 def _find(name: str, all_objects: List[E], obj_name: str) -> E:
     # Finds a record with the given name, case insensitive.
     lower = name.lower()
@@ -79,6 +111,80 @@ def _named(all_objects: List[E]) -> Dict[str, E]:
     # Gives a dictionary with names mapping to the given named records.
     return {o.name: o for o in all_objects}
 
+
+# Endpoint configurations shared by list methods and their iter_list counterparts, which pass iterate=True.
+_events_list = partial(
+    ea_endpoint,
+    'events',
+    'get',
+    query_arg_keys={
+        'codeIds',
+        'createdByCommitteeId',
+        'districtFieldValue',
+        'eventTypeIds',
+        'inRepetitionWithEventId',
+        'startingAfter',
+        'startingBefore',
+        '$expand'
+    },
+    paginated=True,
+    max_top=50,
+    props={'districtFieldValue': EAProperty()},
+    result_factory=Event
+)
+_folders_list = partial(ea_endpoint, 'folders', 'get', paginated=True, result_factory=Folder)
+_job_classes_list = partial(ea_endpoint, '/jobClasses', 'get', paginated=True, result_factory=JobClass)
+_member_statuses_list = partial(ea_endpoint, 'memberStatuses', 'get', paginated=True, result_factory=MemberStatus)
+_minivan_exports_list = partial(
+    ea_endpoint,
+    'minivanExports',
+    'get',
+    query_arg_keys={'createdBy', 'generatedAfter', 'generatedBefore', 'name', '$expand'},
+    paginated=True,
+    max_top=50,
+    result_factory=MiniVANExport
+)
+_online_actions_forms_list = partial(
+    ea_endpoint, 'onlineActionsForms', 'get', paginated=True, result_factory=OnlineActionsForm
+)
+_saved_lists_list = partial(
+    ea_endpoint,
+    'savedLists',
+    'get',
+    query_arg_keys={'folderId', 'maxDoorCount', 'maxPeopleCount'},
+    paginated=True,
+    result_factory=SavedList
+)
+_schedule_types_list = partial(ea_endpoint, 'scheduleTypes', 'get', paginated=True, result_factory=ScheduleType)
+_signups_list = partial(
+    ea_endpoint, 'signups', 'get', query_arg_keys={'eventId', 'vanId'}, paginated=True, result_factory=Signup
+)
+_voter_registration_batches_list = partial(
+    ea_endpoint,
+    'voterRegistrationBatches',
+    'get',
+    query_arg_keys={
+        'createdAfter',
+        'createdBefore',
+        'onlyMyBatches',
+        'personType',
+        'programType',
+        'stateCode',
+        'status',
+        '$orderby'
+    },
+    paginated=True,
+    result_factory=VoterRegistrationBatch
+)
+_worksites_list = partial(
+    ea_endpoint,
+    'worksites',
+    'get',
+    query_arg_keys={'employerId', 'isMyOrganization', '$expand'},
+    paginated=True,
+    result_factory=Worksite
+)
+
 # The services are in the same order as they appear in the EveryAction documentation.
 
 
@@ -1021,7 +1127,8 @@ class Codes(EAService):
 
     @ea_endpoint('codes/{codeId}', 'delete', has_result=False)
     def delete(self, code_id: int, /) -> None:
-        """See `DELETE /codes/{codeId} <https://docs.everyaction.com/reference/delete-codes>`__.
+        """See `DELETE /codes/{codeId} <https://docs.everyaction.com/reference/delete-codes>`__. To delete multiple
+        codes, prefer :meth:`delete_each`, which deletes all of them with a single request.
 
         :param code_id: The *codeId* path parameter.
         """
@@ -1495,24 +1602,16 @@ class Events(EAService):
         :return: The resulting :class:`.Event` object.
         """
 
-    @ea_endpoint(
-        'events',
-        'get',
-        query_arg_keys={
-            'codeIds',
-            'createdByCommitteeId',
-            'districtFieldValue',
-            'eventTypeIds',
-            'inRepetitionWithEventId',
-            'startingAfter',
-            'startingBefore',
-            '$expand'
-        },
-        paginated=True,
-        max_top=50,
-        props={'districtFieldValue': EAProperty()},
-        result_factory=Event
-    )
+    @_events_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[Event]:
+        """See `GET /events <https://docs.everyaction.com/reference/events-1>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.Event` objects, requested one page at a time.
+        """
+
+    @_events_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[Event]:
         """See `GET /events <https://docs.everyaction.com/reference/events-1>`__.
 
@@ -1546,6 +1645,26 @@ class Events(EAService):
             appropriate to unpack here.
         """
 
+    def bulk_delete(self, event_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
+        """Delete the events with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised, but records which were already deleted stay
+        deleted.
+
+        :param event_ids: The IDs of the events to delete.
+        :param max_workers: Maximum number of requests to send at once.
+        """
+        _each(self.delete, event_ids, max_workers)
+
+    def bulk_get(self, event_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Event]:
+        """Get the event with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param event_ids: The IDs of the events to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Event` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, event_ids, max_workers)
+
 
 class ExportJobs(EAService):
     """Represents the `Export Jobs <https://docs.everyaction.com/reference/export-jobs>`__ service."""
@@ -1670,6 +1789,16 @@ class FinancialBatches(EAService):
         :return: List of the resulting :class:`.FinancialBatch` objects.
         """
 
+    def bulk_get(self, batch_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[FinancialBatch]:
+        """Get the financial batch with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param batch_ids: The IDs of the financial batches to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.FinancialBatch` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, batch_ids, max_workers)
+
 
 class Folders(EAService):
     """Represents the `Folders <https://docs.everyaction.com/reference/folders>`__ service."""
@@ -1681,7 +1810,16 @@ class Folders(EAService):
         :param folder_id: The *folderId* path parameter.
         """
 
-    @ea_endpoint('folders', 'get', paginated=True, result_factory=Folder)
+    @_folders_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[Folder]:
+        """See `GET /folders <https://docs.everyaction.com/reference/folders>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.Folder` objects, requested one page at a time.
+        """
+
+    @_folders_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[Folder]:
         """See `GET /folders <https://docs.everyaction.com/reference/folders>`__.
 
@@ -1689,6 +1827,16 @@ class Folders(EAService):
         :param kwargs: The applicable query arguments and JSON data for the request.
         """
 
+    def bulk_get(self, folder_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Folder]:
+        """Get the folder with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param folder_ids: The IDs of the folders to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Folder` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, folder_ids, max_workers)
+
 
 class JobClasses(EAService):
     """Represents the `JobClasses <https://docs.everyaction.com/reference/job-classes>`__ service."""
@@ -1710,7 +1858,16 @@ class JobClasses(EAService):
         :return: The resulting :class:`.JobClass`.
         """
 
-    @ea_endpoint('/jobClasses', 'get', paginated=True, result_factory=JobClass)
+    @_job_classes_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[JobClass]:
+        """See `GET /jobClasses <https://docs.everyaction.com/reference/jobclasses>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.JobClass` objects, requested one page at a time.
+        """
+
+    @_job_classes_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[JobClass]:
         """See `GET /jobClasses <https://docs.everyaction.com/reference/jobclasses>`__.
 
@@ -1719,6 +1876,16 @@ class JobClasses(EAService):
         :return: List of the resulting :class:`.JobClass` objects.
         """
 
+    def bulk_get(self, job_class_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[JobClass]:
+        """Get the job class with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param job_class_ids: The IDs of the job classes to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.JobClass` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, job_class_ids, max_workers)
+
 
 class Locations(EAService):
     """Represents the `Locations <https://docs.everyaction.com/reference/locations>`__ service."""
@@ -1772,6 +1939,26 @@ class Locations(EAService):
         :return: List of the resulting :class:`.Location` objects.
         """
 
+    def bulk_delete(self, location_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
+        """Delete the locations with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised, but records which were already deleted stay
+        deleted.
+
+        :param location_ids: The IDs of the locations to delete.
+        :param max_workers: Maximum number of requests to send at once.
+        """
+        _each(self.delete, location_ids, max_workers)
+
+    def bulk_get(self, location_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Location]:
+        """Get the location with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param location_ids: The IDs of the locations to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Location` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, location_ids, max_workers)
+
 
 class MemberStatuses(EAService):
     """Represents the `Member Statuses <https://docs.everyaction.com/reference/member-statuses>`__ service."""
@@ -1794,7 +1981,16 @@ class MemberStatuses(EAService):
         :return: The resulting :class:`.MemberStatus` object.
         """
 
-    @ea_endpoint('memberStatuses', 'get', paginated=True, result_factory=MemberStatus)
+    @_member_statuses_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[MemberStatus]:
+        """See `GET /memberStatuses <https://docs.everyaction.com/reference/memberstatuses>`__.
+
+        :param limit: Maximum number of records to get for the request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.MemberStatus` objects, requested one page at a time.
+        """
+
+    @_member_statuses_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[MemberStatus]:
         """See `GET /memberStatuses <https://docs.everyaction.com/reference/memberstatuses>`__.
 
@@ -1804,6 +2000,18 @@ class MemberStatuses(EAService):
         :return: List of the resulting :class:`.MemberStatus` objects.
         """
 
+    def bulk_get(
+        self, member_status_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS
+    ) -> List[MemberStatus]:
+        """Get the member status with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param member_status_ids: The IDs of the member statuses to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.MemberStatus` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, member_status_ids, max_workers)
+
 
 class MiniVANExports(EAService):
     """Represents the `MiniVANExports <https://docs.everyaction.com/reference/minivan-exports>`__ service."""
@@ -1817,14 +2025,16 @@ class MiniVANExports(EAService):
         :return: The resulting :class:`.MiniVANExport` object.
         """
 
-    @ea_endpoint(
-        'minivanExports',
-        'get',
-        query_arg_keys={'createdBy', 'generatedAfter', 'generatedBefore', 'name', '$expand'},
-        paginated=True,
-        max_top=50,
-        result_factory=MiniVANExport
-    )
+    @_minivan_exports_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[MiniVANExport]:
+        """See `GET /minivanExports <https://docs.everyaction.com/reference/minivanexports>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.MiniVANExport` objects, requested one page at a time.
+        """
+
+    @_minivan_exports_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[MiniVANExport]:
         """See `GET /minivanExports <https://docs.everyaction.com/reference/minivanexports>`__.
 
@@ -1833,14 +2043,31 @@ class MiniVANExports(EAService):
         :return: List of the resulting :class:`.MiniVANExport` objects.
         """
 
+    def bulk_get(self, export_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[MiniVANExport]:
+        """Get the MiniVAN export with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param export_ids: The IDs of the MiniVAN exports to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.MiniVANExport` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, export_ids, max_workers)
+
 
 class Notes(EAService):
     """Represents the `Notes <https://docs.everyaction.com/reference/notes>`__ service."""
 
-    @ea_endpoint('notes/categories', 'get', result_array=True, result_factory=NoteCategory)
+    @ea_endpoint(
+        'notes/categories',
+        'get',
+        result_array=True,
+        result_factory=NoteCategory,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def categories(self) -> List[NoteCategory]:
         """ See `GET /notes/categories/{noteCategoryId}
         <https://docs.everyaction.com/reference/notescategoriesnotecategoryid>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :return: List of the resulting :class:`.NoteCategory` objects.
         """
@@ -1853,9 +2080,10 @@ class Notes(EAService):
         :return: The resulting :class:`.NoteCategory` object.
         """
 
-    @ea_endpoint('notes/categoryTypes', 'get', result_array=True)
+    @ea_endpoint('notes/categoryTypes', 'get', result_array=True, cache_ttl=_REFERENCE_DATA_TTL)
     def category_types(self) -> List[str]:
         """See `GET /notes/categoryTypes <https://docs.everyaction.com/reference/notescategorytypes>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :return: List of the names of the category types.
         """
@@ -1873,7 +2101,16 @@ class OnlineActionsForms(EAService):
         :return: The resulting :class:`.OnlineActionForm` object.
         """
 
-    @ea_endpoint('onlineActionsForms', 'get', paginated=True, result_factory=OnlineActionsForm)
+    @_online_actions_forms_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[OnlineActionsForm]:
+        """See `GET /onlineActionsForms <https://docs.everyaction.com/reference/onlineactionsforms>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.OnlineActionForm` objects, requested one page at a time.
+        """
+
+    @_online_actions_forms_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[OnlineActionsForm]:
         """See `GET /onlineActionsForms <https://docs.everyaction.com/reference/onlineactionsforms>`__.
 
@@ -1882,13 +2119,32 @@ class OnlineActionsForms(EAService):
         :return: List of the resulting :class:`.OnlineActionForm` objects.
         """
 
+    def bulk_get(
+        self, tracking_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS
+    ) -> List[OnlineActionsForm]:
+        """Get the online actions form with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param tracking_ids: The IDs of the online actions forms to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.OnlineActionsForm` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, tracking_ids, max_workers)
+
 
 class Phones(EAService):
     """Represents the `Phones <https://docs.everyaction.com/reference/phones>`__ service."""
 
-    @ea_endpoint('phones/isCellStatuses', 'get', paginated=True, result_factory=IsCellStatus)
+    @ea_endpoint(
+        'phones/isCellStatuses',
+        'get',
+        paginated=True,
+        result_factory=IsCellStatus,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def is_cell_statuses(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[IsCellStatus]:
         """See `GET /phones/isCellStatuses <https://docs.everyaction.com/reference/phonesiscellstatuses>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
@@ -1921,6 +2177,16 @@ class PrintedLists(EAService):
         :return: List of the resulting :class:`.PrintedList` objects.
         """
 
+    def bulk_get(self, list_numbers: Iterable[str], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[PrintedList]:
+        """Get the printed list with each of the given numbers, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param list_numbers: The numbers of the printed lists to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.PrintedList` objects, in the same order as the given numbers.
+        """
+        return _each(self.get, list_numbers, max_workers)
+
 
 class Relationships(EAService):
     """Represents the `Relationships <https://docs.everyaction.com/reference/relationships>`__ service."""
@@ -1940,25 +2206,45 @@ class ReportedDemographics(EAService):
     <https://docs.everyaction.com/reference/reported-demographics>`__ service.
     """
 
-    @ea_endpoint('reportedEthnicities', 'get', paginated=True, result_factory=ReportedEthnicity)
+    @ea_endpoint(
+        'reportedEthnicities',
+        'get',
+        paginated=True,
+        result_factory=ReportedEthnicity,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def ethnicities(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[ReportedEthnicity]:
         """See `GET /reportedEthnicities <https://docs.everyaction.com/reference/reportedethnicities>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.ReportedEthnicity` objects.
         """
 
-    @ea_endpoint('reportedGenders', 'get', paginated=True, result_factory=ReportedGender)
+    @ea_endpoint(
+        'reportedGenders',
+        'get',
+        paginated=True,
+        result_factory=ReportedGender,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def genders(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[ReportedGender]:
         """See `GET /reportedGenders <https://docs.everyaction.com/reference/reportedgenders>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.ReportedGender` objects.
         """
 
-    @ea_endpoint('reportedLanguagePreferences', 'get', paginated=True, result_factory=ReportedLanguagePreference)
+    @ea_endpoint(
+        'reportedLanguagePreferences',
+        'get',
+        paginated=True,
+        result_factory=ReportedLanguagePreference,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def language_preferences(
         self,
         *,
@@ -1967,33 +2253,55 @@ class ReportedDemographics(EAService):
     ) -> List[ReportedLanguagePreference]:
         """ See `GET /reportedLanguagePreferences
         <https://docs.everyaction.com/reference/reportedlanguagepreferences>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.ReportedLanguagePreference` objects.
         """
 
-    @ea_endpoint('pronouns', 'get', paginated=True, result_factory=Pronoun)
+    @ea_endpoint(
+        'pronouns',
+        'get',
+        paginated=True,
+        result_factory=Pronoun,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def pronouns(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[Pronoun]:
         """See `GET /pronouns <https://docs.everyaction.com/reference/pronouns>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.PreferredPronoun` objects.
         """
 
-    @ea_endpoint('reportedRaces', 'get', paginated=True, result_factory=ReportedRace)
+    @ea_endpoint(
+        'reportedRaces',
+        'get',
+        paginated=True,
+        result_factory=ReportedRace,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def races(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[ReportedRace]:
         """See `GET /reportedRaces <https://docs.everyaction.com/reference/reportedraces>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.ReportedRace` objects.
         """
 
-    @ea_endpoint('reportedSexualOrientations', 'get', paginated=True, result_factory=ReportedSexualOrientation)
+    @ea_endpoint(
+        'reportedSexualOrientations',
+        'get',
+        paginated=True,
+        result_factory=ReportedSexualOrientation,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def sexual_orientations(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[ReportedSexualOrientation]:
         """See `GET /reportedSexualOrientations <https://docs.everyaction.com/reference/reportedsexualorientations>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
@@ -2012,13 +2320,16 @@ class SavedLists(EAService):
         :return: The resulting :class:`.SavedList` object.
         """
 
-    @ea_endpoint(
-        'savedLists',
-        'get',
-        query_arg_keys={'folderId', 'maxDoorCount', 'maxPeopleCount'},
-        paginated=True,
-        result_factory=SavedList
-    )
+    @_saved_lists_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[SavedList]:
+        """See `GET /savedLists <https://docs.everyaction.com/reference/savedlists>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.SavedList` objects, requested one page at a time.
+        """
+
+    @_saved_lists_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[SavedList]:
         """See `GET /savedLists <https://docs.everyaction.com/reference/savedlists>`__.
 
@@ -2033,6 +2344,16 @@ class SavedLists(EAService):
 
         """
 
+    def bulk_get(self, list_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[SavedList]:
+        """Get the saved list with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param list_ids: The IDs of the saved lists to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.SavedList` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, list_ids, max_workers)
+
 
 class ScheduleTypes(EAService):
     """Represents the `Schedule Types <https://docs.everyaction.com/reference/schedule-types>`__ service."""
@@ -2055,7 +2376,16 @@ class ScheduleTypes(EAService):
         :return: The resulting :class:`.ScheduleType` object.
         """
 
-    @ea_endpoint('scheduleTypes', 'get', paginated=True, result_factory=ScheduleType)
+    @_schedule_types_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[ScheduleType]:
+        """See `GET /scheduleTypes <https://docs.everyaction.com/reference/scheduletypes>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.ScheduleType` objects, requested one page at a time.
+        """
+
+    @_schedule_types_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[ScheduleType]:
         """See `GET /scheduleTypes <https://docs.everyaction.com/reference/scheduletypes>`__.
 
@@ -2100,6 +2430,16 @@ class ScoreUpdates(EAService):
         :param kwargs: The applicable query arguments and JSON data for the request.
         """
 
+    def bulk_get(self, update_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[ScoreUpdate]:
+        """Get the score update with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param update_ids: The IDs of the score updates to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.ScoreUpdate` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, update_ids, max_workers)
+
 
 class Scores(EAService):
     """Represents the `Scores <https://docs.everyaction.com/reference/scores>`__ service."""
@@ -2121,6 +2461,16 @@ class Scores(EAService):
         :return: List of the resulting :class:`.Score` objects.
         """
 
+    def bulk_get(self, score_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Score]:
+        """Get the score with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param score_ids: The IDs of the scores to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Score` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, score_ids, max_workers)
+
 
 class ShiftTypes(EAService):
     """Represents the `Shift Types <https://docs.everyaction.com/reference/shift-types>`__ service."""
@@ -2179,7 +2529,16 @@ class Signups(EAService):
         :return: The resulting :class:`.Signup` object.
         """
 
-    @ea_endpoint('signups', 'get', query_arg_keys={'eventId', 'vanId'}, paginated=True, result_factory=Signup)
+    @_signups_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[Signup]:
+        """See `GET /signups <https://docs.everyaction.com/reference/signups-1>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.Signup` objects, requested one page at a time.
+        """
+
+    @_signups_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[Signup]:
         """See `GET /signups <https://docs.everyaction.com/reference/signups-1>`__.
 
@@ -2211,6 +2570,26 @@ class Signups(EAService):
             appropriate to unpack here.
         """
 
+    def bulk_delete(self, signup_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
+        """Delete the signups with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised, but records which were already deleted stay
+        deleted.
+
+        :param signup_ids: The IDs of the signups to delete.
+        :param max_workers: Maximum number of requests to send at once.
+        """
+        _each(self.delete, signup_ids, max_workers)
+
+    def bulk_get(self, signup_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Signup]:
+        """Get the signup with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param signup_ids: The IDs of the signups to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Signup` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, signup_ids, max_workers)
+
 
 class Stories(EAService):
     """Represents the `Stories <https://docs.everyaction.com/reference/stories>`__ service."""
@@ -2289,6 +2668,26 @@ class SupporterGroups(EAService):
         :param van_id: The *vanId* path parameter.
         """
 
+    def bulk_delete(self, group_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
+        """Delete the supporter groups with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised, but records which were already deleted stay
+        deleted.
+
+        :param group_ids: The IDs of the supporter groups to delete.
+        :param max_workers: Maximum number of requests to send at once.
+        """
+        _each(self.delete, group_ids, max_workers)
+
+    def bulk_get(self, group_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[SupporterGroup]:
+        """Get the supporter group with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param group_ids: The IDs of the supporter groups to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.SupporterGroup` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, group_ids, max_workers)
+
 
 class SurveyQuestions(EAService):
     """Represents the `Survey Questions <https://docs.everyaction.com/reference/survey-questions>`__ service."""
@@ -2360,6 +2759,16 @@ class Targets(EAService):
         :return: List of the resulting :class:`.Target` objects.
         """
 
+    def bulk_get(self, target_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Target]:
+        """Get the target with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param target_ids: The IDs of the targets to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Target` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, target_ids, max_workers)
+
 
 class Users(EAService):
     """Represents the `Users <https://docs.everyaction.com/reference/users>`__ service."""
@@ -2424,6 +2833,32 @@ class VoterRegistrationBatches(EAService):
         :return: The resulting :class:`.AddRegistrantsResponse` objects.
         """
 
+    def add_registrants_in_chunks(
+        self,
+        batch_id: int,
+        registrants: List[Registrant],
+        /,
+        *,
+        chunk_size: int = 500,
+        max_workers: int = _DEFAULT_MAX_WORKERS
+    ) -> List[AddRegistrantsResponse]:
+        """Add the given registrants by splitting them into chunks of at most *chunk_size* registrants and sending up
+        to *max_workers* :meth:`add_registrants` requests at once. Useful for large lists of registrants, which would
+        otherwise result in a single very large request.
+
+        :param batch_id: The *batchId* path parameter.
+        :param registrants: List of the :class:`.Registrant` objects to add.
+        :param chunk_size: Maximum number of registrants to add per request.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: The resulting :class:`.AddRegistrantsResponse` objects, in the same order as the given registrants.
+        :raise ValueError: If *chunk_size* is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+        chunks = [registrants[i:i + chunk_size] for i in range(0, len(registrants), chunk_size)]
+        chunk_results = _each(lambda chunk: self.add_registrants(batch_id, data=chunk), chunks, max_workers)
+        return [response for responses in chunk_results for response in responses]
+
     @ea_endpoint(
         'voterRegistrationBatches',
         'post',
@@ -2438,32 +2873,33 @@ class VoterRegistrationBatches(EAService):
         :return: The created :class:`.VoterRegistrationBatch`.
         """
 
-    @ea_endpoint('voterRegistrationBatches/registrationForms', 'get', paginated=True, result_factory=RegistrationForm)
+    @ea_endpoint(
+        'voterRegistrationBatches/registrationForms',
+        'get',
+        paginated=True,
+        result_factory=RegistrationForm,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def forms(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[RegistrationForm]:
         """ See `GET /voterRegistrationBatches/registrationForms
         <https://docs.everyaction.com/reference/voterregistrationbatchesregistrationforms>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.RegistrationForm` objects.
         """
 
-    @ea_endpoint(
-        'voterRegistrationBatches',
-        'get',
-        query_arg_keys={
-            'createdAfter',
-            'createdBefore',
-            'onlyMyBatches',
-            'personType',
-            'programType',
-            'stateCode',
-            'status',
-            '$orderby'
-        },
-        paginated=True,
-        result_factory=VoterRegistrationBatch
-    )
+    @_voter_registration_batches_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[VoterRegistrationBatch]:
+        """See `GET /voterRegistrationBatches <https://docs.everyaction.com/reference/voterregistrationbatches>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: The applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.VoterRegistrationBatch` objects, requested one page at a time.
+        """
+
+    @_voter_registration_batches_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[VoterRegistrationBatch]:
         """See `GET /voterRegistrationBatches <https://docs.everyaction.com/reference/voterregistrationbatches>`__.
 
@@ -2472,10 +2908,17 @@ class VoterRegistrationBatches(EAService):
         :return: List of the resulting :class:`.VoterRegistrationBatch` objects.
         """
 
-    @ea_endpoint('voterRegistrationBatches/programTypes', 'get', paginated=True, result_factory=ProgramType)
+    @ea_endpoint(
+        'voterRegistrationBatches/programTypes',
+        'get',
+        paginated=True,
+        result_factory=ProgramType,
+        cache_ttl=_REFERENCE_DATA_TTL
+    )
     def programs(self, limit: Optional[int] = None, **kwargs: EAValue) -> List[ProgramType]:
         """ See `GET /voterRegistrationBatches/programTypes
         <https://docs.everyaction.com/reference/voterregistrationbatchesprogramtypes>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param kwargs: The applicable query arguments and JSON data for the request.
@@ -2486,7 +2929,8 @@ class VoterRegistrationBatches(EAService):
         'voterRegistrationBatches/states/{state}/supportedFields',
         'get',
         paginated=True,
-        result_factory=SupportField
+        result_factory=SupportField,
+        cache_ttl=_REFERENCE_DATA_TTL
     )
     def supported_fields(
         self,
@@ -2498,6 +2942,7 @@ class VoterRegistrationBatches(EAService):
     ) -> List[SupportField]:
         """ See `GET /voterRegistrationBatches/states/{state}/supportedFields
         <https://docs.everyaction.com/reference/voterregistrationbatchesstatesstatesupportedfields>`__.
+        Results are cached for an hour (see :meth:`.EAClient.clear_cache`).
 
         :param limit: Maximum number of records to get for this request.
         :param state: The *state* path parameter.
@@ -2536,13 +2981,16 @@ class Worksites(EAService):
         :return: The resulting :class:`.Worksite` object.
         """
 
-    @ea_endpoint(
-        'worksites',
-        'get',
-        query_arg_keys={'employerId', 'isMyOrganization', '$expand'},
-        paginated=True,
-        result_factory=Worksite
-    )
+    @_worksites_list(iterate=True)
+    def iter_list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> Iterator[Worksite]:
+        """See `GET /worksites <https://docs.everyaction.com/reference/worksites>`__.
+
+        :param limit: Maximum number of records to get for this request. Unlimited by default.
+        :param kwargs: Applicable query arguments and JSON data for the request.
+        :return: Iterator over the resulting :class:`.Worksite` objects, requested one page at a time.
+        """
+
+    @_worksites_list()
     def list(self, *, limit: Optional[int] = None, **kwargs: EAValue) -> List[Worksite]:
         """See `GET /worksites <https://docs.everyaction.com/reference/worksites>`__.
 
@@ -2550,3 +2998,13 @@ class Worksites(EAService):
         :param kwargs: Applicable query arguments and JSON data for the request.
         :return: List of the resulting :class:`.Worksite` objects.
         """
+
+    def bulk_get(self, worksite_ids: Iterable[int], *, max_workers: int = _DEFAULT_MAX_WORKERS) -> List[Worksite]:
+        """Get the worksite with each of the given IDs, sending up to *max_workers* requests at once.
+        If any request fails, no more are sent and the error is raised.
+
+        :param worksite_ids: The IDs of the worksites to get.
+        :param max_workers: Maximum number of requests to send at once.
+        :return: List of the resulting :class:`.Worksite` objects, in the same order as the given IDs.
+        """
+        return _each(self.get, worksite_ids, max_workers)
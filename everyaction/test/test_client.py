@@ -1,160 +1,208 @@
-import os
+import re
+import time
 import unittest.mock as mock
+from collections import defaultdict
+from concurrent.futures import Future
+from threading import Barrier, Event, Thread
 
 import pytest
+from requests.adapters import HTTPAdapter
 
 from everyaction import EAClient, EAException
 
+# Compiled patterns for exception messages expected by more than one test case.
+APP_NAME_MISSING = re.compile(r'Environment variable EVERYACTION_APP_NAME is missing or empty\.')
+MODE_MISSING = re.compile('mode must either be specified or be implicit')
+SOME_APP_FROM_ENV = re.compile('Neither of app_name=SomeApp or api_key should be specified when from_env is True')
 
-@pytest.fixture(autouse=True)
-def mock_session():
-    # Just in case these were already set in the environment, delete them for a test and then add them back so as
-    # not to interfere.
-    app_name = os.environ.pop('EVERYACTION_APP_NAME', None)
-    api_key = os.environ.pop('EVERYACTION_API_KEY', None)
-    with mock.patch('everyaction.client.Session') as session:
-        yield session
-    if app_name is not None:
-        os.environ['EVERYACTION_APP_NAME'] = app_name
-    if api_key is not None:
-        os.environ['EVERYACTION_API_KEY'] = api_key
 
+class StubSession:
+    # Lightweight stand-in for requests.Session which records the arguments of each call by method name.
+    def __init__(self):
+        self.auth = None
+        self.reset()
 
-def test_init():
-    # Test implicit from_env, asserting that exceptions are raised if the app/key env vars are not both specified.
-    with pytest.raises(EAException, match='Environment variable EVERYACTION_APP_NAME is missing or empty.'):
-        EAClient()
+    def _call(self, name, *args, **kwargs):
+        self.calls[name].append((args, kwargs))
+        side_effect = self.side_effects.get(name)
+        return side_effect(*args, **kwargs) if side_effect else None
 
-    os.environ['EVERYACTION_APP_NAME'] = 'my_app'
-    with pytest.raises(EAException, match='Environment variable EVERYACTION_API_KEY is missing or empty.'):
-        EAClient()
-
-    del os.environ['EVERYACTION_APP_NAME']
-    os.environ['EVERYACTION_API_KEY'] = 'key'
-    with pytest.raises(EAException, match='Environment variable EVERYACTION_APP_NAME is missing or empty.'):
-        EAClient()
+    def reset(self):
+        # Method name -> List of (args, kwargs) for each call.
+        self.calls = defaultdict(list)
+        # Method name -> Function to call in place of that method.
+        self.side_effects = {}
 
-    os.environ['EVERYACTION_APP_NAME'] = 'my_app'
-    with pytest.raises(EAException, match='mode must either be specified or be implicit'):
-        # Mode not implicit in api key (since it doesn't end with |0 or |1) so this should still raise an exception.
-        EAClient()
+    def close(self):
+        self._call('close')
 
-    client = EAClient(mode=0)
-    assert client.app_name == 'my_app'
-    assert client._session.auth[1] == 'key|0'
+    def delete(self, *args, **kwargs):
+        return self._call('delete', *args, **kwargs)
 
-    # Check default endpoint is US endpoint.
-    assert client.endpoint == 'https://api.securevan.com/v4'
+    def get(self, *args, **kwargs):
+        return self._call('get', *args, **kwargs)
 
-    # Check mode is VoterFile (0).
-    assert client.mode == 'VoterFile'
+    def mount(self, *args, **kwargs):
+        self._call('mount', *args, **kwargs)
 
-    # Check that we can give the mode name instead of 0.
-    client = EAClient(mode='VoterFile')
+    def patch(self, *args, **kwargs):
+        return self._call('patch', *args, **kwargs)
 
-    # Check that API key correctly created in this case.
-    assert client._session.auth[1] == 'key|0'
+    def post(self, *args, **kwargs):
+        return self._call('post', *args, **kwargs)
 
-    # Same checks for MyCampaign (1).
-    client = EAClient(mode=1)
-    assert client._session.auth[1] == 'key|1'
-    assert client.mode == 'MyCampaign'
+    def put(self, *args, **kwargs):
+        return self._call('put', *args, **kwargs)
 
-    # Check case insensitivity.
-    client = EAClient(mode='mycampaign')
-    assert client._session.auth[1] == 'key|1'
 
-    with pytest.raises(EAException, match=r'Mode number \(2\) is too high \(expected at most 1\)'):
-        # Mode number too high.
-        EAClient(mode=2)
+@pytest.fixture(scope='module', autouse=True)
+def patched_session():
+    # Patch Session once for the whole module rather than for every test. Each client constructs its own StubSession,
+    # so that the auth and adapters set up by one client are not seen by the others.
+    with mock.patch('everyaction.client.Session', StubSession):
+        yield
 
-    with pytest.raises(EAException, match=r'Mode number \(-1\) is negative'):
-        # Mode number negative.
-        EAClient(mode=-1)
 
-    with pytest.raises(EAException, match='Unrecognized mode "SomethingElse"'):
-        # Unrecognized mode.
-        EAClient(mode='SomethingElse')
+@pytest.fixture(autouse=True)
+def clear_env(monkeypatch):
+    # Just in case these were already set in the environment, delete them for a test so as not to interfere.
+    # monkeypatch restores them afterwards, even if the test fails.
+    monkeypatch.delenv('EVERYACTION_APP_NAME', raising=False)
+    monkeypatch.delenv('EVERYACTION_API_KEY', raising=False)
 
-    with pytest.raises(
-        EAException,
-        match='Neither of app_name=SomeApp or api_key should be specified when from_env is True'
-    ):
-        EAClient('SomeApp', from_env=True)
 
-    with pytest.raises(
-        EAException,
-        match='Neither of app_name=None or api_key should be specified when from_env is True'
-    ):
-        EAClient(api_key='key', from_env=True)
+@pytest.fixture(scope='module')
+def shared_client(patched_session):
+    # Client shared by tests which do not modify it.
+    return EAClient('my_app', 'key|0')
 
-    with pytest.raises(
-        EAException,
-        match='Neither of app_name=SomeApp or api_key should be specified when from_env is True'
-    ):
-        EAClient('SomeApp', 'key', from_env=True)
 
-    # Make sure explicitly setting from_env=True is allowed.
-    EAClient(mode=1, from_env=True)
+@pytest.fixture
+def client(shared_client):
+    # Clear the calls recorded by the shared client's session in previous tests.
+    shared_client._session.reset()
+    return shared_client
 
-    # Clean environment before testing non-env constructions.
-    del os.environ['EVERYACTION_APP_NAME']
-    del os.environ['EVERYACTION_API_KEY']
 
-    with pytest.raises(EAException, match='api_key must be given'):
-        # Need API key.
-        EAClient('my_app')
+@pytest.fixture
+def env_both(monkeypatch):
+    # Give both the app name and API key via the environment, with the mode not implicit in the API key.
+    monkeypatch.setenv('EVERYACTION_APP_NAME', 'my_app')
+    monkeypatch.setenv('EVERYACTION_API_KEY', 'key')
 
-    with pytest.raises(EAException, match='app_name must be given'):
-        # Need app name.
-        EAClient(api_key='key|0')
 
-    with pytest.raises(EAException, match='mode must either be specified or be implicit'):
-        # Need mode.
-        EAClient('my_app', 'key')
+@pytest.mark.parametrize('app_name, api_key, match', [
+    (None, None, APP_NAME_MISSING),
+    ('my_app', None, 'Environment variable EVERYACTION_API_KEY is missing or empty.'),
+    (None, 'key', APP_NAME_MISSING),
+    # Mode not implicit in api key (since it doesn't end with |0 or |1) so this should still raise an exception.
+    ('my_app', 'key', MODE_MISSING)
+])
+def test_init_env_errors(monkeypatch, app_name, api_key, match):
+    # Test implicit from_env, asserting that exceptions are raised if the app/key env vars are not both specified.
+    if app_name is not None:
+        monkeypatch.setenv('EVERYACTION_APP_NAME', app_name)
+    if api_key is not None:
+        monkeypatch.setenv('EVERYACTION_API_KEY', api_key)
+    with pytest.raises(EAException, match=match):
+        EAClient()
 
-    # Explicitly specifying from_env=False is OK.
-    EAClient('my_app', 'key|0', from_env=False)
 
-    # Constructor fine, mode implicit in API key.
-    client = EAClient('my_app', 'key|0')
+@pytest.mark.parametrize('mode, expected_key, expected_mode', [
+    (0, 'key|0', 'VoterFile'),
+    # Check that we can give the mode name instead of 0.
+    ('VoterFile', 'key|0', 'VoterFile'),
+    (1, 'key|1', 'MyCampaign'),
+    # Check case insensitivity.
+    ('mycampaign', 'key|1', 'MyCampaign')
+])
+def test_init_mode_valid(env_both, mode, expected_key, expected_mode):
+    client = EAClient(mode=mode)
     assert client.app_name == 'my_app'
-    assert client._session.auth[1] == 'key|0'
-
-    with pytest.raises(EAException, match='mode specified but mode already indicated in API key'):
-        # Can't specify mode when it is implicit in API key.
-        EAClient('my_app', 'key|0', mode=0)
-
-    client = EAClient('my_app', 'key', mode='MyCampaign')
-    assert client._session.auth[1] == 'key|1'
-
+    assert client._session.auth[1] == expected_key
+    assert client.mode == expected_mode
+
+
+@pytest.mark.parametrize('args, kwargs, match', [
+    # Mode number too high.
+    ((), {'mode': 2}, r'Mode number \(2\) is too high \(expected at most 1\)'),
+    # Mode number negative.
+    ((), {'mode': -1}, r'Mode number \(-1\) is negative'),
+    # Unrecognized mode.
+    ((), {'mode': 'SomethingElse'}, 'Unrecognized mode "SomethingElse"'),
+    (('SomeApp',), {'from_env': True}, SOME_APP_FROM_ENV),
+    (
+        (),
+        {'api_key': 'key', 'from_env': True},
+        'Neither of app_name=None or api_key should be specified when from_env is True'
+    ),
+    (('SomeApp', 'key'), {'from_env': True}, SOME_APP_FROM_ENV),
+    # Need API key.
+    (('my_app',), {}, 'api_key must be given'),
+    # Need app name.
+    ((), {'api_key': 'key|0'}, 'app_name must be given'),
+    # Need mode.
+    (('my_app', 'key'), {}, MODE_MISSING),
+    # Can't specify mode when it is implicit in API key.
+    (('my_app', 'key|0'), {'mode': 0}, 'mode specified but mode already indicated in API key'),
+    # Mode implicit in API key must still be valid
+    (('my_app', 'key|3'), {}, r'Mode number \(3\) is too high \(expected at most 1\)')
+])
+def test_init_errors(env_both, args, kwargs, match):
+    with pytest.raises(EAException, match=match):
+        EAClient(*args, **kwargs)
+
+
+@pytest.mark.parametrize('alias, expected_url', [
+    ('US', 'https://api.securevan.com/v4'),
+    # Check case insensitivity.
+    ('uS', 'https://api.securevan.com/v4'),
+    ('INTL', 'https://intlapi.securevan.com/v4'),
     # Make sure a literal endpoint can be given, even if it is not the US or INTL endpoint.
-    client = EAClient('my_app', 'key|0', endpoint='http://example.com')
+    ('http://example.com', 'http://example.com')
+])
+def test_init_endpoint(alias, expected_url):
+    client = EAClient('my_app', 'key|0', endpoint=alias)
+    assert client.endpoint == expected_url
     assert client.mode == 'VoterFile'
-    assert client.endpoint == 'http://example.com'
 
+
+def test_init_endpoint_invalid():
     with pytest.raises(EAException, match='Unrecognized endpoint alias example.com'):
         # Endpoint must start with http to be given literally.
         EAClient('my_app', 'key|0', endpoint='example.com')
 
-    # Test US alias.
-    client = EAClient('my_app', 'key|0', endpoint='US')
-    assert client.endpoint == 'https://api.securevan.com/v4'
 
-    # Check case insensitivity.
-    client = EAClient('my_app', 'key|0', endpoint='uS')
+def test_init(env_both):
+    # Check default endpoint is US endpoint.
+    client = EAClient(mode=0)
     assert client.endpoint == 'https://api.securevan.com/v4'
 
-    # Test INTL alias.
-    client = EAClient('my_app', 'key|0', endpoint='INTL')
-    assert client.endpoint == 'https://intlapi.securevan.com/v4'
+    # Make sure explicitly setting from_env=True is allowed.
+    EAClient(mode=1, from_env=True)
 
-    with pytest.raises(EAException, match=r'Mode number \(3\) is too high \(expected at most 1\)'):
-        # Mode implicit in API key must still be valid
-        EAClient('my_app', 'key|3')
+    # Explicitly specifying from_env=False is OK.
+    EAClient('my_app', 'key|0', from_env=False)
 
+    # Constructor fine, mode implicit in API key.
+    client = EAClient('my_app', 'key|0')
+    assert client.app_name == 'my_app'
+    assert client._session.auth[1] == 'key|0'
 
-def test_instance():
+    client = EAClient('my_app', 'key', mode='MyCampaign')
+    assert client._session.auth[1] == 'key|1'
+
+
+def test_instance(monkeypatch):
+    pool_sizes = []
+
+    class RecordingAdapter(HTTPAdapter):
+        # Records the connection pool size each adapter is given.
+        def __init__(self, *args, pool_maxsize, **kwargs):
+            pool_sizes.append(pool_maxsize)
+            super().__init__(*args, pool_maxsize=pool_maxsize, **kwargs)
+
+    monkeypatch.setattr('everyaction.client.HTTPAdapter', RecordingAdapter)
     client = EAClient('my_app', 'key|0')
 
     # Test default_limit getter/setter
@@ -167,6 +215,25 @@ def test_instance():
     with pytest.raises(ValueError, match='default_limit must be at least 0, not -1'):
         client.default_limit = -1
 
+    # Test that the session's connection pools are configured for both secure and insecure endpoints.
+    mounted = [args[0] for args, _ in client._session.calls['mount']]
+    assert 'https://' in mounted
+    assert 'http://' in mounted
+
+    # Test that every client shares the same retry policy.
+    assert all(args[1].max_retries is EAClient._RETRY for args, _ in client._session.calls['mount'])
+
+    # Test that the connection pool size defaults to 64, grows with burst, and may be given explicitly.
+    EAClient('my_app', 'key|0', rate_limit=100, burst=100)
+    EAClient('my_app', 'key|0', pool_size=8)
+    assert pool_sizes == [64, 100, 8]
+    # Test that an invalid pool size is rejected before a session is created.
+    session_factory = mock.Mock(wraps=StubSession)
+    monkeypatch.setattr('everyaction.client.Session', session_factory)
+    with pytest.raises(EAException, match='pool_size must be at least 1, not 0'):
+        EAClient('my_app', 'key|0', pool_size=0)
+    session_factory.assert_not_called()
+
     # Test that repr is what is expected. Note that api_key is intentionally absent.
     assert (
         str(client) ==
@@ -174,20 +241,93 @@ def test_instance():
     )
 
 
-def test_requests(mock_session):
+@pytest.mark.parametrize('verb', ['delete', 'get', 'patch', 'post', 'put'])
+def test_requests(client, verb):
     # Test that arguments are passed to a requests Session object as expected.
     # Nothing complicated to test here, just ensure that arguments are passed and that route is prepended with the
     # correct endpoint.
-    client = EAClient('my_app', 'key|0')
+    getattr(client, verb)('some/route', json={'my': 'data'})
+    assert client._session.calls[verb] == [(('https://api.securevan.com/v4/some/route',), {'json': {'my': 'data'}})]
+
+
+def test_concurrent_gets(monkeypatch):
+    # Test that identical GET requests sent concurrently result in only one request when coalesce_gets is True.
+    waiting = Event()
 
-    client.delete('some/route', json={'my': 'data'})
-    client.get('some/route', json={'my': 'data'})
-    client.patch('some/route', json={'my': 'data'})
-    client.post('some/route', json={'my': 'data'})
-    client.put('some/route', json={'my': 'data'})
-
-    mock_session().delete.assert_called_with('https://api.securevan.com/v4/some/route', json={'my': 'data'})
-    mock_session().get.assert_called_with('https://api.securevan.com/v4/some/route', json={'my': 'data'})
-    mock_session().patch.assert_called_with('https://api.securevan.com/v4/some/route', json={'my': 'data'})
-    mock_session().post.assert_called_with('https://api.securevan.com/v4/some/route', json={'my': 'data'})
-    mock_session().put.assert_called_with('https://api.securevan.com/v4/some/route', json={'my': 'data'})
+    class WaitedFuture(Future):
+        # Signals when another thread starts waiting on the request in flight instead of sending its own.
+        def result(self, timeout=None):
+            waiting.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr('everyaction.client.Future', WaitedFuture)
+    client = EAClient('my_app', 'key|0', coalesce_gets=True)
+    sent = Event()
+
+    def slow_get(url, **kwargs):
+        sent.set()
+        # Only finish the request once the second thread is waiting on it.
+        waiting.wait(5)
+        return url
+
+    client._session.side_effects['get'] = slow_get
+    results = []
+    threads = [Thread(target=lambda: results.append(client.get('some/route', params={'a': 1}))) for _ in range(2)]
+    threads[0].start()
+    sent.wait(5)
+    threads[1].start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['https://api.securevan.com/v4/some/route'] * 2
+    assert len(client._session.calls['get']) == 1
+
+    # Requests which are not concurrent should still be sent separately.
+    client.get('some/route', params={'a': 1})
+    assert len(client._session.calls['get']) == 2
+
+
+def test_concurrent_gets_not_coalesced():
+    # Test that identical GET requests sent concurrently are each sent by default.
+    client = EAClient('my_app', 'key|0')
+    # Both requests must be sent at the same time for either to finish.
+    barrier = Barrier(2, timeout=5)
+
+    def barrier_get(url, **kwargs):
+        barrier.wait()
+        return url
+
+    client._session.side_effects['get'] = barrier_get
+    results = []
+    threads = [Thread(target=lambda: results.append(client.get('some/route', params={'a': 1}))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['https://api.securevan.com/v4/some/route'] * 2
+    assert len(client._session.calls['get']) == 2
+
+
+def test_rate_limit(monkeypatch):
+    # Test that requests beyond the burst size are delayed to stay under the rate limit.
+    client = EAClient('my_app', 'key|0', rate_limit=20, burst=2)
+    start = time.monotonic()
+    for _ in range(4):
+        client.post('some/route')
+    # The first 2 requests are sent immediately, and each of the other 2 must wait 1/20 seconds.
+    assert time.monotonic() - start >= 0.09
+    assert len(client._session.calls['post']) == 4
+
+    # Test that invalid arguments are rejected before a session is created.
+    session_factory = mock.Mock(wraps=StubSession)
+    monkeypatch.setattr('everyaction.client.Session', session_factory)
+    with pytest.raises(EAException, match='rate_limit must be positive, not 0'):
+        EAClient('my_app', 'key|0', rate_limit=0)
+
+    with pytest.raises(EAException, match='burst must be at least 1, not 0'):
+        EAClient('my_app', 'key|0', rate_limit=1, burst=0)
+
+    with pytest.raises(EAException, match='burst may only be specified when rate_limit is specified'):
+        EAClient('my_app', 'key|0', burst=2)
+    session_factory.assert_not_called()
@@ -1,12 +1,12 @@
+import functools
+import itertools
 import json
 import textwrap
-import time
-import traceback
+import threading
 import unittest.mock as mock
 import urllib.parse
-from collections import OrderedDict
+from concurrent import futures
 from datetime import datetime
-from threading import Thread
 from unittest.mock import call
 
 from requests import Response
@@ -15,21 +15,34 @@ from http_router import Router
 
 import pytest
 
-from everyaction import EAClient, EAChangedEntityJobFailedException, EAFindFailedException
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from everyaction import EAClient, EAChangedEntityJobFailedException, EAFindFailedException, EAHTTPException
 from everyaction.objects import *
 from everyaction.services import ChangedEntities
 
 
 router = Router()
 ENDPOINT = 'http://example.com'
+_ENDPOINT_LEN = len(ENDPOINT)
+
+# Use orjson for the mock's JSON encoding and decoding when it is available.
+_dumps = orjson.dumps if orjson else lambda obj: json.dumps(obj).encode()
+_loads = orjson.loads if orjson else json.loads
+
+# Request bodies which need not be parsed.
+_EMPTY_BODIES = {'{}', b'{}'}
 
 
-class EAData(OrderedDict):
+class EAData(dict):
     # Storage for data which have IDs.
     def __init__(self, prefix, **kwargs):
         super().__init__(**kwargs)
         self.id_key = f'{prefix}Id'
-        self._next_id = 1
+        self._next_id = itertools.count(1).__next__
 
     def add(self, data):
         next_id = self.next_id()
@@ -37,10 +50,20 @@ class EAData(OrderedDict):
         data[self.id_key] = next_id
         return data
 
+    def add_all(self, data):
+        # Add each of the given data at once.
+        with_ids = {self.next_id(): d for d in data}
+        for next_id, d in with_ids.items():
+            d[self.id_key] = next_id
+        self.update(with_ids)
+        return data
+
+    def clear(self):
+        super().clear()
+        self._next_id = itertools.count(1).__next__
+
     def next_id(self):
-        next_id = self._next_id
-        self._next_id += 1
-        return next_id
+        return self._next_id()
 
 
 # noinspection PyUnusedLocal
@@ -58,12 +81,20 @@ class MockServer:
     def __init__(self):
         self.activist_codes = EAData('activistCode')
         self.changed_entity_export_jobs = EAData('exportJob')
+        # Set whenever an export job is created so tests can wait for it without polling.
+        self.export_job_created = threading.Event()
         self.contact_types = EAData('contactType')
+        self.events = EAData('event')
         self.export_job_types = EAData('exportJobType')
         self.input_types = EAData('inputType')
         self.people = EAData('van')
         self.result_codes = EAData('resultCode')
+        self.signups = EAData('eventSignup')
+        # Maps voter registration batch IDs to the alternate IDs of the registrants added by each request.
+        self.batch_to_registrant_requests = {}
 
+        # Maps email addresses to the people who have them, keyed by VAN ID, so find does not scan every person.
+        self.email_to_people = {}
         self.my_activists = set()
         self.person_to_activist_code_data = {}
         self.person_to_codes = {}
@@ -85,16 +116,17 @@ class MockServer:
         return True
 
     @staticmethod
-    def _paginated(records, query):
-        records = list(records)
-        top = query.get('$top', 50)
-        skip = query.get('$skip', 0)
+    def _paginated(route, records, query):
+        # Values parsed out of a nextPageLink are strings.
+        top = int(query.get('$top', 50))
+        skip = int(query.get('$skip', 0))
         end = skip + top
-        result = records[skip:end]
-        if len(result) > end:
-            query[skip] = end
-            query_str = urllib.parse.urlencode(query)
-            next_page_link = f'{ENDPOINT}?{query_str}'
+        # Only walk as far as the requested page instead of copying all records.
+        it = iter(records)
+        result = list(itertools.islice(it, skip, end))
+        if next(it, None) is not None:
+            query_str = urllib.parse.urlencode({**query, '$skip': end})
+            next_page_link = f'{ENDPOINT}{route}?{query_str}'
         else:
             next_page_link = None
         return {
@@ -104,16 +136,32 @@ class MockServer:
         }
 
     def _find(self, match_candidate):
-        for person in self.people.values():
+        emails = match_candidate.get('emails')
+        # Since _match compares the whole list, a matching person must have the first candidate email.
+        people = self.email_to_people.get(emails[0]['email'], {}) if emails else self.people
+        for person in people.values():
             if self._match(person, match_candidate):
                 return person
         return None
 
+    def _index_emails(self, person, index=True):
+        # Add or remove (when index is False) person in email_to_people.
+        for email in person.get('emails', []):
+            if index:
+                self.email_to_people.setdefault(email['email'], {})[person['vanId']] = person
+            else:
+                self.email_to_people.get(email['email'], {}).pop(person['vanId'], None)
+
     def add_activist_code(self, data):
         return self.activist_codes.add(data)
 
+    def add_activist_codes(self, names):
+        return self.activist_codes.add_all([{'name': name} for name in names])
+
     def add_changed_entity_export_job(self, data):
-        return self.changed_entity_export_jobs.add(data)
+        job = self.changed_entity_export_jobs.add(data)
+        self.export_job_created.set()
+        return job
 
     def add_changed_entity_resource(self, name, change_types, fields):
         self.changed_entity_resources[name] = (change_types, fields)
@@ -121,6 +169,9 @@ class MockServer:
     def add_contact_type(self, data):
         return self.contact_types.add(data)
 
+    def add_event(self, data):
+        return self.events.add(data)
+
     def add_export_job_type(self, data):
         return self.export_job_types.add(data)
 
@@ -129,12 +180,26 @@ class MockServer:
 
     def add_person(self, data):
         van_id = self.people.add(data)['vanId']
+        self._index_emails(data)
         self.person_to_membership[van_id] = {}
         return van_id
 
     def add_result_code(self, data):
         return self.result_codes.add(data)
 
+    def add_result_codes(self, names):
+        return self.result_codes.add_all([{'name': name} for name in names])
+
+    def add_signup(self, data):
+        return self.signups.add(data)
+
+    def reset(self):
+        # Clear all data in place so that the same server may be used by multiple tests.
+        for value in vars(self).values():
+            if isinstance(value, (dict, set)):
+                value.clear()
+        self.export_job_created.clear()
+
     def update_changed_entity_export_job(self, job_id, with_data):
         self.changed_entity_export_jobs.get(job_id).update(with_data)
 
@@ -144,7 +209,7 @@ class MockServer:
 
     @router.route('/activistCodes', methods=['GET'])
     def activist_codes_list(self, query, data):
-        return self._paginated(self.activist_codes.values(), query)
+        return self._paginated('/activistCodes', self.activist_codes.values(), query)
 
     @router.route('/canvassResponses/contactTypes', methods=['GET'])
     def canvass_response_contact_types(self, query, data):
@@ -197,13 +262,23 @@ class MockServer:
     def changed_entity_resources(self, query, data):
         return list(self.changed_entity_resources)
 
+    @router.route('/events/{event_id:int}', methods=['DELETE'])
+    def event_delete(self, event_id, query, data):
+        if self.events.pop(event_id, None) is None:
+            return self.NOT_FOUND
+
+    @router.route('/events/{event_id:int}', methods=['GET'])
+    def event_get(self, event_id, query, data):
+        return self.events.get(event_id, self.NOT_FOUND)
+
     @router.route('/exportJobTypes', methods=['GET'])
     def export_job_types(self, query, data):
-        return self._paginated(list(self.export_job_types.values()), query)
+        return self._paginated('/exportJobTypes', self.export_job_types.values(), query)
 
     @router.route('/people/{van_id:int}/activistCodes', methods=['GET'])
     def person_activist_codes(self, van_id, query, data):
         return self._paginated(
+            f'/people/{van_id}/activistCodes',
             [self.activist_codes[x] for x in self.person_to_activist_code_data.get(van_id, [])],
             query
         )
@@ -216,7 +291,7 @@ class MockServer:
         else:
             for response in data['responses']:
                 if response['type'] == 'ActivistCode':
-                    activist_code_data = self.person_to_activist_code_data.setdefault(van_id, OrderedDict())
+                    activist_code_data = self.person_to_activist_code_data.setdefault(van_id, {})
                     activist_code_id = response['activistCodeId']
                     activist_code = self.activist_codes.get(activist_code_id)
                     if activist_code is None:
@@ -258,16 +333,62 @@ class MockServer:
 
     @router.route('/people/{van_id:int}/notes', methods=['GET'])
     def person_notes(self, van_id, query, data):
-        return self._paginated(self.person_to_notes.get(van_id, {}).values(), query)
+        return self._paginated(f'/people/{van_id}/notes', self.person_to_notes.get(van_id, {}).values(), query)
 
     @router.route('/people/{van_id:int}', methods=['POST'])
     def person_update(self, van_id, query, data):
         person = self.people.get(van_id)
         if person is None:
             return self.NOT_FOUND
+        self._index_emails(person, index=False)
         person.update(data)
+        self._index_emails(person)
         return person
 
+    @router.route('/voterRegistrationBatches/{batch_id:int}/people', methods=['POST'])
+    def registrants_add(self, batch_id, query, data):
+        alternate_ids = [registrant['alternateId'] for registrant in data]
+        self.batch_to_registrant_requests.setdefault(batch_id, []).append(alternate_ids)
+        return [{'alternateId': alternate_id, 'result': 'Success'} for alternate_id in alternate_ids]
+
+    @router.route('/signups/{signup_id:int}', methods=['DELETE'])
+    def signup_delete(self, signup_id, query, data):
+        if self.signups.pop(signup_id, None) is None:
+            return self.NOT_FOUND
+
+    @router.route('/signups/{signup_id:int}', methods=['GET'])
+    def signup_get(self, signup_id, query, data):
+        return self.signups.get(signup_id, self.NOT_FOUND)
+
+
+@functools.lru_cache(maxsize=256)
+def resolve(route, method):
+    # Tests request the same few routes many times, so cache the target and path parameters matched for each of them.
+    match = router(route, method=method)
+    return match.target, tuple((match.params or {}).items())
+
+
+class MockResponse:
+    # Minimal stand-in for a successful requests.Response. The content is only serialized when it is read, which
+    # endpoints without results never do.
+    __slots__ = ('result', 'status_code')
+
+    reason = 'OK'
+
+    def __init__(self, result, status_code=200):
+        self.result = result
+        self.status_code = status_code
+
+    def __bool__(self):
+        return True
+
+    @property
+    def content(self):
+        return _dumps(self.result)
+
+    def json(self):
+        return self.result
+
 
 class MockSession:
     # Simulated session which calls the appropriate method in MockServer.
@@ -276,26 +397,30 @@ class MockSession:
         self.server = server
 
     def handle(self, url, method, **kwargs):
-        data = json.loads(kwargs.get('data', '{}'))
+        raw_data = kwargs.get('data')
+        # Most requests have no body, which the client sends as an empty JSON object.
+        data = _loads(raw_data) if raw_data and raw_data not in _EMPTY_BODIES else {}
         params = kwargs.get('params', {})
-        query_in_url = urllib.parse.urlparse(url).query
+        # URLs always start with ENDPOINT, so the route and query string may be split off without fully parsing the URL.
+        route, _, query_in_url = url[_ENDPOINT_LEN:].partition('?')
         if query_in_url:
-            params |= urllib.parse.parse_qs(query_in_url)
-        route = url[len(ENDPOINT):]
-        match = router(route, method=method)
-        path_params = match.params or {}
-        result = match.target(self.server, **path_params, query=params, data=data)
-        resp = Response()
-        resp.reason = 'OK'
-        resp.status_code = 200
+            # Merge into a new dict rather than updating the caller's query arguments in place.
+            params = {**params, **dict(urllib.parse.parse_qsl(query_in_url))}
+        target, path_params = resolve(route, method)
+        result = target(self.server, **dict(path_params), query=params, data=data)
+        code = 200
         if isinstance(result, tuple):
-            data, code = result
-            resp.status_code = code
-            if code >= 400 and 'errors' in data:
-                resp.reason = data['errors'][0]['text']
-            resp._content = json.dumps(data).encode()
-        else:
-            resp._content = json.dumps(result).encode()
+            result, code = result
+        if code < 400:
+            # Successful responses are only checked for truthiness and read via content, so skip constructing a full
+            # requests.Response for them.
+            return MockResponse(result, code)
+        # EAHTTPException relies on Response.raise_for_status and Response.json, so use a real Response for errors.
+        resp = Response()
+        resp.status_code = code
+        resp.reason = result['errors'][0]['text'] if 'errors' in result else 'Error'
+        resp.url = url
+        resp._content = _dumps(result)
         return resp
 
     def close(self):
@@ -317,24 +442,38 @@ class MockSession:
         return self.handle(route, 'PUT', **kwargs)
 
 
-@pytest.fixture
-def server():
+@pytest.fixture(scope='module')
+def shared_server():
     return MockServer()
 
 
-@pytest.fixture
-def client(server):
+@pytest.fixture(scope='module')
+def shared_client(shared_server):
     client = EAClient('app', 'key', endpoint=ENDPOINT, mode=1)
-    client._session = MockSession(server)
+    client._session = MockSession(shared_server)
     return client
 
 
+@pytest.fixture
+def server(shared_server):
+    # Reuse the same server for every test, clearing it instead of constructing a new one.
+    shared_server.reset()
+    return shared_server
+
+
+@pytest.fixture
+def client(shared_client, server):
+    shared_client.clear_cache()
+    return shared_client
+
+
 def test_people(client, server):
     server.add_person({'emails': [{'email': 'alice@bob.com'}]})
 
     # Try looking up with both email and ID.
-    assert client.people.lookup(email='alice@bob.com') == Person(id=1, email='alice@bob.com')
-    assert client.people.lookup(id=1) == Person(id=1, email='alice@bob.com')
+    alice = Person(id=1, email='alice@bob.com')
+    assert client.people.lookup(email='alice@bob.com') == alice
+    assert client.people.lookup(id=1) == alice
 
     # Try updating Alice with update_if_exists.
     assert client.people.update_if_exists({'email': 'alice@bob.com'}, {'first': 'Alice'})
@@ -346,8 +485,7 @@ def test_people(client, server):
     # Confirm looking up with a bad email results in None.
     assert client.people.lookup(email='bob@alice.com') is None
 
-    server.add_activist_code({'name': 'Cool Activist'})
-    server.add_activist_code({'name': 'Activist Person'})
+    server.add_activist_codes(['Cool Activist', 'Activist Person'])
 
     # Add activist code with activist code ID.
     client.people.apply_activist_code(1, email='alice@bob.com')
@@ -371,13 +509,13 @@ def test_people(client, server):
 
     # Add some notes.
     client.people.apply_notes(Note(text='Is neat'), email='alice@bob.com')
-    assert client.people.notes(1) == [Note(id=1, text='Is neat')]
+    note1 = Note(id=1, text='Is neat')
+    assert client.people.notes(1) == [note1]
 
     client.people.apply_notes(Note(text='Has a cool shirt'), email='alice@bob.com')
-    assert client.people.notes(1) == [Note(id=1, text='Is neat'), Note(id=2, text='Has a cool shirt')]
+    assert client.people.notes(1) == [note1, Note(id=2, text='Has a cool shirt')]
 
-    server.add_result_code({'name': 'No call'})
-    server.add_result_code({'name': 'No text'})
+    server.add_result_codes(['No call', 'No text'])
 
     # Apply some result codes.
     # First by ID.
@@ -505,9 +643,7 @@ def test_activist_codes(client, server):
     assert client.activist_codes.find('Cool Activist') == ActivistCode(id=1, name='Cool Activist')
 
     # Add more activist codes and try to find multiple with find_each.
-    server.add_activist_code({'name': 'Cooler Activist'})
-    server.add_activist_code({'name': 'Coolest Activist'})
-    server.add_activist_code({'name': 'Someone Else'})
+    server.add_activist_codes(['Cooler Activist', 'Coolest Activist', 'Someone Else'])
     assert client.activist_codes.find_each(['Cooler Activist', 'Someone Else']) == {
         'Cooler Activist': ActivistCode(id=2, name='Cooler Activist'),
         'Someone Else': ActivistCode(id=4, name='Someone Else')
@@ -524,6 +660,58 @@ def test_activist_codes(client, server):
         client.activist_codes.find_each(['Cool Activist', 'Someone Else'])
 
 
+def test_bulk(client, server):
+    for name in ['Rally', 'Canvass', 'Phone Bank', 'Training']:
+        server.add_event({'name': name})
+
+    # Test that results are in the same order as the given IDs, even when fewer workers than IDs are used.
+    events = client.events.bulk_get([3, 1, 4, 2], max_workers=2)
+    assert [event.id for event in events] == [3, 1, 4, 2]
+    assert [event.name for event in events] == ['Phone Bank', 'Rally', 'Training', 'Canvass']
+
+    # Test that an error for any one of the requests is raised to the caller.
+    with pytest.raises(EAHTTPException, match='Not found'):
+        client.events.bulk_get([1, 5, 2])
+
+    client.events.bulk_delete([1, 3])
+    assert set(server.events) == {2, 4}
+    with pytest.raises(EAHTTPException, match='Not found'):
+        client.events.bulk_delete([2, 3])
+
+    # Test that once a request fails, no more are sent, so no more events are deleted.
+    with pytest.raises(EAHTTPException, match='Not found'):
+        client.events.bulk_delete([3, 4], max_workers=1)
+    assert set(server.events) == {4}
+
+    # Test the same for a service whose IDs are prefixed.
+    for van_id in [10, 20, 30]:
+        server.add_signup({'eventId': 2, 'person': {'vanId': van_id}})
+    signups = client.signups.bulk_get([2, 3, 1])
+    assert [signup.id for signup in signups] == [2, 3, 1]
+    assert [signup.person.van_id for signup in signups] == [20, 30, 10]
+    with pytest.raises(EAHTTPException, match='Not found'):
+        client.signups.bulk_get([4])
+
+    client.signups.bulk_delete([1, 2])
+    assert set(server.signups) == {3}
+    with pytest.raises(EAHTTPException, match='Not found'):
+        client.signups.bulk_delete([1, 3], max_workers=1)
+    assert set(server.signups) == {3}
+
+
+def test_add_registrants_in_chunks(client, server):
+    registrants = [Registrant(alternate_id=str(i)) for i in range(7)]
+    responses = client.registration_batches.add_registrants_in_chunks(1, registrants, chunk_size=3)
+
+    # Test that the registrants were split into chunks of at most 3, and that the responses are flattened in order.
+    assert sorted(server.batch_to_registrant_requests[1]) == [['0', '1', '2'], ['3', '4', '5'], ['6']]
+    assert [response.alternate_id for response in responses] == [str(i) for i in range(7)]
+
+    for chunk_size in [0, -1]:
+        with pytest.raises(ValueError, match='chunk_size must be at least 1'):
+            client.registration_batches.add_registrants_in_chunks(1, registrants, chunk_size=chunk_size)
+
+
 def test_changed_entities(client, server):
     bool_field = ChangedEntityField('bool', type='B')
     date_field = ChangedEntityField('date', type='D')
@@ -548,19 +736,18 @@ def test_changed_entities(client, server):
     # Convert to dict since we are using default JSON serialization.
     change_fields = [dict(f) for f in [bool_field, date_field, money_field, num_field, text_field]]
     server.add_changed_entity_resource('TestResource', change_types, change_fields)
-    with mock.patch('requests.get') as mock_get:
+    # Reuse a single worker thread to run changed_entities.changes in the background.
+    with mock.patch('requests.get') as mock_get, futures.ThreadPoolExecutor(max_workers=1) as executor:
         changes_result = []
 
-        def target(cache=None, expect_failure=False):
+        def target(cache=None):
             try:
                 changes_result.append(
                     client.changed_entities.changes(cache, changed_from='2000-01-01', resource='TestResource')
                 )
             except Exception as e:
-                if expect_failure:
-                    changes_result.append(e)
-                else:
-                    changes_result.append(traceback.format_exc())
+                # When a failure is not expected, the exception is re-raised from the test with its traceback intact.
+                changes_result.append(e)
 
         next_job = 1
 
@@ -569,24 +756,21 @@ def test_changed_entities(client, server):
 
             # First, wait for client to request a new export job.
             # This may be done by waiting for the server to have export jobs up to job_id.
-            deadline = time.time() + 5
-            while len(server.changed_entity_export_jobs) < next_job and time.time() < deadline:
-                time.sleep(0.001)
-
-            if len(server.changed_entity_export_jobs) < next_job:
+            if not server.export_job_created.wait(5) or len(server.changed_entity_export_jobs) < next_job:
                 raise AssertionError('Job not created in time.')
 
             # Now, update status of job so that changes can proceed.
             server.update_changed_entity_export_job(next_job, data_to_update_with)
-            changes_thread.join(5)
-            if changes_thread.is_alive():
+            try:
+                changes_future.result(5)
+            except futures.TimeoutError:
                 raise AssertionError('Changes thread did not stop in time.')
 
+            server.export_job_created.clear()
             next_job += 1
 
         # Have changed_entities.changes run in the background while we complete the job.
-        changes_thread = Thread(target=target)
-        changes_thread.start()
+        changes_future = executor.submit(target)
 
         result_data1 = textwrap.dedent('''\
         bool,date,money,num,text
@@ -620,8 +804,8 @@ def test_changed_entities(client, server):
         mock_get.side_effect = [MockResp(result_data1), MockResp(result_data2)]
 
         update_and_wait(update_data)
-        if isinstance(changes_result[0], str):
-            raise AssertionError(f'Unexpected exception: {changes_result[0]}')
+        if isinstance(changes_result[0], Exception):
+            raise AssertionError('Unexpected exception') from changes_result[0]
         assert changes_result == [[
             {'bool': True, 'date': datetime(1818, 5, 5), 'money': '$50.00', 'num': 272, 'text': 'Hi everybody'},
             {'bool': False, 'date': datetime(1928, 12, 7), 'money': '$10.00', 'num': 141, 'text': 'Hello Dr. Nick'},
@@ -636,15 +820,14 @@ def test_changed_entities(client, server):
         field_cache = [bool_field, num_field, ignored_field, text_field]
 
         changes_result.clear()
-        changes_thread = Thread(target=target, args=(field_cache,))
-        changes_thread.start()
+        changes_future = executor.submit(target, field_cache)
 
         mock_get.reset_mock()
         mock_get.side_effect = [MockResp(result_data1), MockResp(result_data2)]
         update_and_wait(update_data)
 
-        if isinstance(changes_result[0], str):
-            raise AssertionError(f'Unexpected exception: {changes_result[0]}')
+        if isinstance(changes_result[0], Exception):
+            raise AssertionError('Unexpected exception') from changes_result[0]
 
         assert changes_result == [[
             {'bool': True, 'num': 272, 'text': 'Hi everybody'},
@@ -655,8 +838,7 @@ def test_changed_entities(client, server):
 
         # Same test, but with only 1 file.
         changes_result.clear()
-        changes_thread = Thread(target=target)
-        changes_thread.start()
+        changes_future = executor.submit(target)
 
         mock_get.reset_mock()
         mock_get.side_effect = None
@@ -665,8 +847,8 @@ def test_changed_entities(client, server):
         update_data['exportedRecordCount'] = 2
 
         update_and_wait(update_data)
-        if isinstance(changes_result[0], str):
-            raise AssertionError(f'Unexpected exception: {changes_result[0]}')
+        if isinstance(changes_result[0], Exception):
+            raise AssertionError('Unexpected exception') from changes_result[0]
 
         assert changes_result == [[
             {'bool': True, 'date': datetime(1818, 5, 5), 'money': '$50.00', 'num': 272, 'text': 'Hi everybody'},
@@ -678,8 +860,7 @@ def test_changed_entities(client, server):
         changes_result.clear()
         mock_get.reset_mock()
         mock_get.side_effect = AssertionError('Get should not have been called.')
-        changes_thread = Thread(target=target, kwargs={'expect_failure': True})
-        changes_thread.start()
+        changes_future = executor.submit(target)
         update_and_wait({'jobStatus': 'Error'})
 
         assert len(changes_result) == 1
@@ -687,8 +868,7 @@ def test_changed_entities(client, server):
 
         # Now with unknown job status.
         changes_result.clear()
-        changes_thread = Thread(target=target, kwargs={'expect_failure': True})
-        changes_thread.start()
+        changes_future = executor.submit(target)
         update_and_wait({'jobStatus': 'FakeStatus'})
 
         assert len(changes_result) == 1
@@ -696,114 +876,129 @@ def test_changed_entities(client, server):
         assert 'Unexpected job status: FakeStatus' in str(changes_result[0])
 
 
-def test_finds(client, server):
-    def test_find(find_fn, name_fn, add_fn, factory, obj_name):
-        # Test that failing to find a record results in an EAFindFailedException.
-        with pytest.raises(EAFindFailedException, match=f'No such {obj_name}'):
-            find_fn('obj 1')
-
-        # Add a record and try to find it.
-        data1 = factory(**add_fn({'name': 'obj 1'}))
-        assert find_fn('obj 1') == data1
-
-        # Add another record. Try to find both.
-        data2 = factory(**add_fn({'name': 'obj 2'}))
-        assert find_fn('obj 1') == data1
-        assert find_fn('obj 2') == data2
-        with pytest.raises(EAFindFailedException, match=f'No such {obj_name}'):
-            find_fn('obj 3')
-
-        assert name_fn() == {
-            'obj 1': data1,
-            'obj 2': data2
-        }
-
+def _change_type_finds(client, server):
     change_types = []
-    fields = []
-    server.add_changed_entity_resource('TestResource', change_types, fields)
-
-    next_ct_id = 1
+    server.add_changed_entity_resource('TestResource', change_types, [])
 
     def add_change_type(data):
-        nonlocal next_ct_id
-        data['changeTypeID'] = next_ct_id
-        next_ct_id += 1
+        data['changeTypeID'] = len(change_types) + 1
         change_types.append(data)
         return data
 
-    def add_field(data):
-        fields.append(data)
-        return data
-
-    test_find(
+    return (
         lambda name: client.changed_entities.find_change_type('TestResource', name),
         lambda: client.changed_entities.name_to_change_type('TestResource'),
         add_change_type,
-        ChangeType,
-        'change type'
+        ChangeType
     )
-    test_find(
+
+
+def _field_finds(client, server):
+    fields = []
+    server.add_changed_entity_resource('TestResource', [], fields)
+
+    def add_field(data):
+        fields.append(data)
+        return data
+
+    return (
         lambda name: client.changed_entities.find_field('TestResource', name),
         lambda: client.changed_entities.name_to_field('TestResource'),
         add_field,
-        ChangedEntityField,
-        'field'
+        ChangedEntityField
     )
-    test_find(
-        client.canvass_responses.find_contact_type,
-        client.canvass_responses.name_to_contact_type,
-        server.add_contact_type,
-        ContactType,
+
+
+# Each finds function gives the find function, the name-to-record function, the function to add a record to the
+# server, and the factory for the records, in that order.
+@pytest.mark.parametrize('finds, obj_name', [
+    (_change_type_finds, 'change type'),
+    (_field_finds, 'field'),
+    (
+        lambda client, server: (
+            client.canvass_responses.find_contact_type,
+            client.canvass_responses.name_to_contact_type,
+            server.add_contact_type,
+            ContactType
+        ),
         'contact type'
-    )
-    test_find(
-        client.canvass_responses.find_input_type,
-        client.canvass_responses.name_to_input_type,
-        server.add_input_type,
-        InputType,
+    ),
+    (
+        lambda client, server: (
+            client.canvass_responses.find_input_type,
+            client.canvass_responses.name_to_input_type,
+            server.add_input_type,
+            InputType
+        ),
         'input type'
-    )
-    test_find(
-        client.canvass_responses.find_result_code,
-        client.canvass_responses.name_to_result_code,
-        server.add_result_code,
-        ResultCode,
+    ),
+    (
+        lambda client, server: (
+            client.canvass_responses.find_result_code,
+            client.canvass_responses.name_to_result_code,
+            server.add_result_code,
+            ResultCode
+        ),
         'result code'
-    )
-    test_find(
-        client.export_jobs.find_type,
-        client.export_jobs.name_to_type,
-        server.add_export_job_type,
-        ExportJobType,
+    ),
+    (
+        lambda client, server: (
+            client.export_jobs.find_type,
+            client.export_jobs.name_to_type,
+            server.add_export_job_type,
+            ExportJobType
+        ),
         'export job type'
     )
+])
+def test_finds(client, server, finds, obj_name):
+    find_fn, name_fn, add_fn, factory = finds(client, server)
+
+    # Test that failing to find a record results in an EAFindFailedException.
+    with pytest.raises(EAFindFailedException, match=f'No such {obj_name}'):
+        find_fn('obj 1')
+
+    # Add a record and try to find it.
+    data1 = factory(**add_fn({'name': 'obj 1'}))
+    assert find_fn('obj 1') == data1
+
+    # Add another record. Try to find both.
+    data2 = factory(**add_fn({'name': 'obj 2'}))
+    assert find_fn('obj 1') == data1
+    assert find_fn('obj 2') == data2
+    with pytest.raises(EAFindFailedException, match=f'No such {obj_name}'):
+        find_fn('obj 3')
+
+    assert name_fn() == {
+        'obj 1': data1,
+        'obj 2': data2
+    }
 
 
-def test_suppressions() -> None:
-    # Test that suppressions can be tested for whether or not they are "Do Not Call", "Do Not Email", or "Do Not Mail"
-    do_not_call1 = Suppression('NC')
-    do_not_call2 = Suppression('Do Not Call')
-    do_not_email1 = Suppression('NE')
-    do_not_email2 = Suppression('Do Not Email')
-    do_not_mail1 = Suppression('NM')
-    do_not_mail2 = Suppression('Do Not Mail')
-    do_not_walk1 = Suppression('NW')
-    do_not_walk2 = Suppression('Do Not Walk')
-
-    assert do_not_call1.no_call
-    assert do_not_call2.no_call
-    assert Suppression.DO_NOT_CALL.no_call
-    assert do_not_email1.no_email
-    assert do_not_email2.no_email
-    assert Suppression.DO_NOT_EMAIL.no_email
-    assert do_not_mail1.no_mail
-    assert do_not_mail2.no_mail
-    assert Suppression.DO_NOT_MAIL.no_mail
-    assert do_not_walk1.no_walk
-    assert do_not_walk2.no_walk
-    assert Suppression.DO_NOT_WALK.no_walk
-
-    assert not do_not_call1.no_email
-    assert not do_not_email2.no_mail
-    assert not do_not_mail1.no_walk
-    assert not do_not_walk2.no_call
+# Test that suppressions can be tested for whether or not they are "Do Not Call", "Do Not Email", or "Do Not Mail"
+@pytest.mark.parametrize('suppression, attr', [
+    (Suppression('NC'), 'no_call'),
+    (Suppression('Do Not Call'), 'no_call'),
+    (Suppression.DO_NOT_CALL, 'no_call'),
+    (Suppression('NE'), 'no_email'),
+    (Suppression('Do Not Email'), 'no_email'),
+    (Suppression.DO_NOT_EMAIL, 'no_email'),
+    (Suppression('NM'), 'no_mail'),
+    (Suppression('Do Not Mail'), 'no_mail'),
+    (Suppression.DO_NOT_MAIL, 'no_mail'),
+    (Suppression('NW'), 'no_walk'),
+    (Suppression('Do Not Walk'), 'no_walk'),
+    (Suppression.DO_NOT_WALK, 'no_walk')
+])
+def test_suppressions(suppression, attr) -> None:
+    assert getattr(suppression, attr)
+
+
+@pytest.mark.parametrize('suppression, attr', [
+    (Suppression('NC'), 'no_email'),
+    (Suppression('Do Not Email'), 'no_mail'),
+    (Suppression('NM'), 'no_walk'),
+    (Suppression('Do Not Walk'), 'no_call')
+])
+def test_suppressions_negative(suppression, attr) -> None:
+    assert not getattr(suppression, attr)
@@ -22,22 +22,32 @@ class OtherBasicObject(
     pass
 
 
+@pytest.mark.parametrize('get', [
+    lambda obj: obj.sim,
+    lambda obj: obj['sim'],
+    lambda obj: obj.simple,
+    lambda obj: obj['simple']
+])
+def test_basic_aliases(get):
+    # Test that aliases are resolved correctly and that getattr and getitem behave the same way.
+    assert get(BasicObject(sim=1)) == 1
+
+
 def test_basic():
     obj = BasicObject(sim=1, withFactory='2', single='3')
 
-    # Test that factories are called correctly, aliases are resolved correctly, and that getattr and getitem behave
-    # the same way.
-    assert obj.sim == obj['sim'] == obj.simple == obj['simple'] == 1
+    # Test that factories are called correctly.
     assert obj.fact == 2
     assert obj.array_prop == [3]
 
     # Make sure each property shows up in the object's repr.
+    rep = str(obj)
     for string in ['simple=1', 'withFactory=2', 'arrayProp=[3]']:
-        assert string in str(obj)
+        assert string in rep
 
     # Make sure repr formatted correctly.
-    assert str(obj).startswith('BasicObject(')
-    assert str(obj).endswith(')')
+    assert rep.startswith('BasicObject(')
+    assert rep.endswith(')')
 
     # Try to set array_prop, make sure factory still called and wrapping occurs when using singular alias.
     obj.single = '4'
@@ -69,27 +79,28 @@ def test_basic():
     obj.sim = None
     assert str(obj) == 'BasicObject()'
 
-    # Test equality.
-
-    assert BasicObject() == BasicObject()
-
-    # Need to match both properties and type.
-    assert BasicObject() != {}
-    assert BasicObject() != OtherBasicObject()
-
-    assert BasicObject(sim=1) == BasicObject(simple=1)
-    assert BasicObject(sim=1) != OtherBasicObject(sim=1)
-    assert BasicObject(simple=1) != {'simple': 1}
-
-    assert BasicObject() != BasicObject(sim=1)
-    assert BasicObject(sim=1) != BasicObject(sim=2)
-    assert BasicObject(sim=1) != BasicObject(sim=1, fact=3)
-
     with pytest.raises(ValueError, match='Multiple aliases with different values given for simple'):
         # Make sure specifying multiple names for the same property is not allowed.
         BasicObject(sim=1, simple=2)
 
 
+# Test equality. Objects need to match both properties and type to be equal.
+@pytest.mark.parametrize('lhs, rhs, equal', [
+    (BasicObject(), BasicObject(), True),
+    (BasicObject(), {}, False),
+    (BasicObject(), OtherBasicObject(), False),
+    (BasicObject(sim=1), BasicObject(simple=1), True),
+    (BasicObject(sim=1), OtherBasicObject(sim=1), False),
+    (BasicObject(simple=1), {'simple': 1}, False),
+    (BasicObject(), BasicObject(sim=1), False),
+    (BasicObject(sim=1), BasicObject(sim=2), False),
+    (BasicObject(sim=1), BasicObject(sim=1, fact=3), False)
+])
+def test_basic_equality(lhs, rhs, equal):
+    assert (lhs == rhs) is equal
+    assert (lhs != rhs) is not equal
+
+
 def test_nested():
     class NestedObject(
         EAObject, basic=EAProperty(factory=BasicObject), basics=EAProperty(is_array=True, factory=BasicObject)
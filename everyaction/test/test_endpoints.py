@@ -1,7 +1,6 @@
 import json
 import os.path
-
-from makefun import wraps
+from functools import wraps
 
 import pytest
 
@@ -40,7 +39,7 @@ def _skip_if_empty_else_first(resource_name, records):
     return records[0]
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope='module')
 def setup():
     everyaction.core._fail_on_unrecognized = True
     try:
@@ -53,7 +52,7 @@ def skip_if_403(func):
     @wraps(func)
     def wrapper(**kwargs):
         try:
-            func(**kwargs)
+            return func(**kwargs)
         except EAHTTPException as e:
             if e.response.status_code == 403:
                 # If we got a 403 error, we did not fail to find the endpoint, but could not verify that we could parse
@@ -95,6 +94,13 @@ def changed_entity_export_job(data):
     return _skip_if_absent('changed_entity_export_job', data)
 
 
+@pytest.fixture(scope='module')
+@skip_if_403
+def changed_entity_resources(client):
+    # Several tests need changed entity resources, so only list them once.
+    return client.changed_entities.resources()
+
+
 @pytest.fixture
 def contribution(data):
     return _skip_if_absent('contribution', data)
@@ -238,26 +244,27 @@ def test_changed_entities(client, changed_entity_export_job):
 
 
 @skip_if_403
-def test_changed_entity_change_types(client):
-    resources = client.changed_entities.resources()
-    if resources:
-        _skip_if_empty_else_first('changed entity change types', client.changed_entities.change_types(resources[0]))
+def test_changed_entity_change_types(client, changed_entity_resources):
+    if changed_entity_resources:
+        _skip_if_empty_else_first(
+            'changed entity change types',
+            client.changed_entities.change_types(changed_entity_resources[0])
+        )
     else:
         pytest.skip('No changed entity resource found to search change types for.')
 
 
 @skip_if_403
-def test_changed_entity_fields(client):
-    resources = client.changed_entities.resources()
-    if resources:
-        _skip_if_empty_else_first('changed entity fields', client.changed_entities.fields(resources[0]))
+def test_changed_entity_fields(client, changed_entity_resources):
+    if changed_entity_resources:
+        _skip_if_empty_else_first('changed entity fields', client.changed_entities.fields(changed_entity_resources[0]))
     else:
         pytest.skip('No changed entity resource found to search for fields for.')
 
 
 @skip_if_403
-def test_changed_entity_resources(client):
-    _skip_if_empty_else_first('changed entity resource', client.changed_entities.resources())
+def test_changed_entity_resources(changed_entity_resources):
+    _skip_if_empty_else_first('changed entity resource', changed_entity_resources)
 
 
 @skip_if_403
@@ -439,6 +446,7 @@ def test_person_activist_codes(client, person):
 
 @skip_if_403
 def test_person_get(client, person):
+    # The person fixture was retrieved with expand, so also check getting the person without it.
     assert client.people.get(person.id).id == person.id
     assert client.people.get_('VANID', person.id).id == person.id
 
@@ -467,7 +475,6 @@ def test_person_membership(client, person):
 @skip_if_403
 def test_person_notes(client, person):
     _skip_if_empty_else_first('notes for given person', client.people.notes(person.id))
-    client.people.notes(person.id)
 
 
 @skip_if_403
@@ -1,20 +1,39 @@
 import json as pyjson  # "json" conflicts with necessary keyword arguments.
 from collections.abc import Sequence
-from urllib.parse import parse_qs, urlparse
+from functools import lru_cache
+from urllib.parse import parse_qs
 
 import pytest
 from requests import HTTPError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import everyaction.core
-from everyaction import EAException, EAHTTPException
-from everyaction.core import ea_endpoint, EAObject, EAProperty, EAService
+from everyaction import EAClient, EAException, EAHTTPException
+from everyaction.core import ea_endpoint, EAObject, EAObjectEncoder, EAProperty, EAService
 from everyaction.objects import Error
+from everyaction.services import Events, Signups
+
+
+# Use orjson to decode request data when it is available.
+_loads = orjson.loads if orjson else pyjson.loads
+
+
+@lru_cache(maxsize=256)
+def _parse_query(query):
+    # Parse query args appearing in a route. The same pages are requested repeatedly, so cache the results, which must
+    # not be mutated.
+    return {k: v[0] for k, v in parse_qs(query).items()}
 
 
 def structs_to_dicts(obj):
-    # Convert EAObject objects to nested dicts for equality checking purposes.
+    # Convert EAObject objects to nested dicts for equality checking purposes. The items of an EAObject are those of its
+    # __dict__, which is read directly to avoid getting each of them through the mapping interface.
     if isinstance(obj, EAObject):
-        return {k: structs_to_dicts(v) for k, v in obj.items()}
+        return {k: structs_to_dicts(v) for k, v in vars(obj).items()}
     if isinstance(obj, Sequence) and not isinstance(obj, str):
         return [structs_to_dicts(x) for x in obj]
     return obj
@@ -25,6 +44,10 @@ class MockResponse:
         self.data = data
         self.status_code = code
 
+    @property
+    def content(self):
+        return pyjson.dumps(self.data, cls=EAObjectEncoder).encode()
+
     def json(self):
         return self.data
 
@@ -57,10 +80,12 @@ class MockEAClient:
         self.req_type = req_type
         self.route = route
         self.query = query or {}
-        self.json = pyjson.loads(data) if data else json if json else {}
+        self.json = _loads(data) if data else json if json else {}
 
         # Get any query args appearing in route and add to self.query.
-        self.query.update({k: v[0] for k, v in parse_qs(urlparse(route).query).items()})
+        base_route, _, query_in_route = route.partition('?')
+        if query_in_route:
+            self.query.update(_parse_query(query_in_route))
 
         if self.paginated:
             skip = int(self.query.get('$skip', 0))
@@ -79,7 +104,7 @@ class MockEAClient:
                 new_top = min(count - new_skip, top)
                 page_json = {
                     'items': self.resp_json[skip:skip + top],
-                    'nextPageLink': f'{self.endpoint}/{route}?$top={new_top}&$skip={new_skip}',
+                    'nextPageLink': f'{self.endpoint}/{base_route}?$top={new_top}&$skip={new_skip}',
                     'count': count
                 }
             response = MockResponse(page_json, self.code)
@@ -570,6 +595,10 @@ def test_pagination(client):
         def not_paginated(self, **kwargs):
             pass
 
+        @ea_endpoint('paginated/request', 'get', paginated=True, max_top=3, result_factory=Structure1, iterate=True)
+        def iterated(self, **kwargs):
+            pass
+
     group = PaginationGroup(client)
     client.paginated = True
 
@@ -617,6 +646,35 @@ def test_pagination(client):
         Structure1(**data[4])
     ]
 
+    # Test that iterate=True lazily gives the same records, requesting the next page only when it is needed.
+    records = group.iterated(limit=0)
+    assert not isinstance(records, list)
+    assert [next(records) for _ in range(3)] == [Structure1(**data[0]), Structure1(**data[1]), Structure1(**data[2])]
+    assert client.query['$skip'] == 0
+    assert list(records) == [Structure1(**data[3]), Structure1(**data[4])]
+    assert client.query['$skip'] == '3'
+    assert list(group.iterated(limit=4)) == [
+        Structure1(**data[0]), Structure1(**data[1]), Structure1(**data[2]), Structure1(**data[3])
+    ]
+
+    # Test that iterate ignores default_limit (currently 2), giving every record when limit is not specified.
+    assert list(group.iterated()) == [Structure1(**x) for x in data]
+
+    # Test that at most limit records are returned even if the server responds with more records than requested.
+    client.paginated = False
+    client.resp_json = {'items': data, 'nextPageLink': None, 'count': len(data)}
+    assert group.paginated(limit=2) == [Structure1(**data[0]), Structure1(**data[1])]
+    client.paginated = True
+    client.resp_json = data
+
+    # Test that iterate may only be specified for paginated requests.
+    with pytest.raises(AssertionError, match='may only be specified when paginated=True'):
+        # noinspection PyUnusedLocal
+        class IterateNotPaginated(EAService):
+            @ea_endpoint('iterate/not-paginated', 'get', iterate=True)
+            def get(self, **kwargs):
+                pass
+
     # Test that paginated and result_array cannot simultaneously be specified.
     with pytest.raises(AssertionError, match='At most one of'):
         # noinspection PyUnusedLocal
@@ -640,6 +698,22 @@ def test_pagination(client):
         group.not_paginated(limit=5)
 
 
+def test_iter_list(client):
+    # Test that iter_list streams every record by default rather than stopping at the client's default_limit.
+    client.paginated = True
+    client.default_limit = 50
+    client.resp_json = [{'eventId': i} for i in range(120)]
+    events = Events(client)
+    assert [event.id for event in events.iter_list()] == list(range(120))
+    assert [event.id for event in events.iter_list(limit=60)] == list(range(60))
+    # list still defaults to default_limit.
+    assert len(events.list()) == 50
+
+    # Test the same for an endpoint whose records have prefixed IDs.
+    client.resp_json = [{'eventSignupId': i} for i in range(120)]
+    assert [signup.id for signup in Signups(client).iter_list()] == list(range(120))
+
+
 def test_error_response(client):
     class ErrorGroup(EAService):
         @ea_endpoint('error/route', 'get')
@@ -668,3 +742,71 @@ def test_error_response(client):
     exc = exc_info.value
     assert exc.errors == errors
     assert exc.response.json() == {'errors': errors}
+
+
+def test_cache_ttl(client):
+    class CachedGroup(EAService):
+        @ea_endpoint(
+            'cached/route',
+            'get',
+            query_arg_keys={'name'},
+            props={'name': EAProperty()},
+            result_array=True,
+            cache_ttl=60
+        )
+        def get(self, **kwargs):
+            pass
+
+    group = CachedGroup(client)
+    client.resp_json = [{'a': 1}]
+    assert group.get() == [{'a': 1}]
+
+    # The second call should be served from the cache, so the new response data should not be seen.
+    client.resp_json = [{'a': 2}]
+    result = group.get()
+    assert result == [{'a': 1}]
+
+    # Mutating a cached result should not affect the cache.
+    result.append({'a': 3})
+    assert group.get() == [{'a': 1}]
+
+    # Different arguments result in a new request.
+    assert group.get(name='x') == [{'a': 2}]
+
+
+def test_clear_cache(client):
+    # Use a real client, with the mock client standing in for its session.
+    ea = EAClient('app', 'key|0', endpoint=client.endpoint)
+    ea._session = client
+    client.paginated = True
+    client.resp_json = [{'reportedGenderId': 1, 'reportedGenderName': 'Female'}]
+    assert [gender.name for gender in ea.demographics.genders()] == ['Female']
+
+    # The cached result is returned until the cache is cleared, after which a new request is made.
+    client.resp_json = [{'reportedGenderId': 2, 'reportedGenderName': 'Male'}]
+    assert [gender.name for gender in ea.demographics.genders()] == ['Female']
+    ea.clear_cache()
+    assert [gender.name for gender in ea.demographics.genders()] == ['Male']
+
+
+def test_cache_ttl_default_limit(client):
+    class CachedGroup(EAService):
+        @ea_endpoint('cached/route', 'get', paginated=True, cache_ttl=60)
+        def list(self, **kwargs):
+            pass
+
+    group = CachedGroup(client)
+    client.paginated = True
+    client.resp_json = [{'a': i} for i in range(5)]
+
+    client.default_limit = 2
+    assert group.list() == [{'a': 0}, {'a': 1}]
+    assert group.list() == [{'a': 0}, {'a': 1}]
+
+    # Results cached under the previous default limit should not be returned once it changes.
+    client.default_limit = 5
+    assert group.list() == [{'a': i} for i in range(5)]
+
+    # An explicit limit equal to the default limit shares the same cached result.
+    client.resp_json = []
+    assert group.list(limit=5) == [{'a': i} for i in range(5)]